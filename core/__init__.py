@@ -50,6 +50,9 @@ from .constants import (
     MAX_CONCURRENT_INSTALLATIONS,
     CHOCOLATEY_SOURCE,
     CHOCOLATEY_INSTALL_ARGS,
+    PACKAGE_CACHE_DIR_NAME,
+    PACKAGE_CACHE_TTL_HOURS,
+    PACKAGE_CACHE_SOURCE_NAME,
     
     # File Operations
     MAX_SINGLE_FILE_SIZE,
@@ -333,6 +336,9 @@ __all__ = [
     'MAX_CONCURRENT_INSTALLATIONS',
     'CHOCOLATEY_SOURCE',
     'CHOCOLATEY_INSTALL_ARGS',
+    'PACKAGE_CACHE_DIR_NAME',
+    'PACKAGE_CACHE_TTL_HOURS',
+    'PACKAGE_CACHE_SOURCE_NAME',
     'MAX_SINGLE_FILE_SIZE',
     'MAX_TOTAL_COPY_SIZE',
     'BACKUP_FILE_EXTENSION',
@@ -402,6 +402,21 @@ class ConfigManager:
         self._presets[name] = packages[:]
         return self.save_presets()
     
+    def add_presets_bulk(self, presets: Dict[str, List[str]]) -> bool:
+        """
+        Add or replace several presets, saving the presets file once.
+        
+        Entries without a name or packages are skipped, as add_preset
+        would reject them.
+        """
+        added = False
+        for name, packages in presets.items():
+            if name and packages:
+                self._presets[name] = packages[:]
+                added = True
+        
+        return self.save_presets() if added else True
+    
     def update_preset(self, name: str, packages: List[str]) -> bool:
         """Update an existing preset."""
         if name not in self._presets:
@@ -82,6 +82,11 @@ CHOCOLATEY_INSTALL_ARGS = [
     "--ignore-checksums"
 ]
 
+# Local package cache (nupkg files downloaded ahead of install)
+PACKAGE_CACHE_DIR_NAME = "choco_cache"
+PACKAGE_CACHE_TTL_HOURS = 24
+PACKAGE_CACHE_SOURCE_NAME = "it-admin-tool-cache"  # cache source registered by earlier versions, removed on sight
+
 # =============================================================================
 # FILE OPERATIONS
 # =============================================================================
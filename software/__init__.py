@@ -5,7 +5,7 @@ This module provides comprehensive software package management functionality
 including Chocolatey integration, package searching, installation, and preset management.
 """
 
-from .chocolatey_manager import ChocolateyManager, ChocolateyInstallWorker
+from .chocolatey_manager import ChocolateyManager, ChocolateyInstallWorker, get_default_manager
 from .package_installer import PackageInstaller, PackageInstallWorker
 from .package_search import PackageSearcher, PackageSearchWorker
 from .presets_manager import PresetsManager
@@ -13,6 +13,7 @@ from .presets_manager import PresetsManager
 __all__ = [
     'ChocolateyManager',
     'ChocolateyInstallWorker',
+    'get_default_manager',
     'PackageInstaller', 
     'PackageInstallWorker',
     'PackageSearcher',
@@ -8,6 +8,8 @@ timeout protection, and proper progress tracking for GUI integration.
 import subprocess
 import logging
 import re
+import socket
+import threading
 import time
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple, Union, Any
@@ -207,26 +209,38 @@ class ChocolateyManager:
         self._chocolatey_path = None
         self._is_available = None
         self._version = None
+        self._availability_time = 0.0
+        self._availability_ttl = 60  # seconds
         
         # Cache for installed packages
         self._installed_cache = {}
         self._cache_time = 0
         self._cache_ttl = 300  # 5 minutes
         
+        # Cached connectivity check result and when it was made
+        self._connectivity: Optional[Tuple[bool, str]] = None
+        self._connectivity_time = 0.0
+        self._connectivity_ttl = 60  # seconds
+        
         logging.info("Chocolatey manager initialized")
     
     def is_chocolatey_available(self) -> bool:
         """
         Check if Chocolatey is installed and available.
         
+        The result is reused for a minute, so a search or install checks
+        availability with at most one "choco --version" run.
+        
         Returns:
             bool: True if Chocolatey is available
         """
-        if self._is_available is not None:
+        now = time.monotonic()
+        if self._is_available is not None and now - self._availability_time < self._availability_ttl:
             return self._is_available
         
+        self._availability_time = now
         try:
-            return_code, stdout, stderr = run_command_with_timeout("choco --version", timeout=10)
+            return_code, stdout, stderr = run_command_with_timeout(["choco", "--version"], timeout=10)
             
             if return_code == 0:
                 self._is_available = True
@@ -252,6 +266,13 @@ class ChocolateyManager:
         """
         return self.is_chocolatey_available()
     
+    def invalidate(self) -> None:
+        """Forget cached availability and connectivity (e.g. after installing Chocolatey)."""
+        self._is_available = None
+        self._version = None
+        self._chocolatey_path = None
+        self._connectivity = None
+    
     def get_chocolatey_version(self) -> str:
         """
         Get Chocolatey version.
@@ -297,7 +318,7 @@ class ChocolateyManager:
         
         try:
             # Test 1: Basic version check
-            return_code, stdout, stderr = run_command_with_timeout("choco --version", timeout=15)
+            return_code, stdout, stderr = run_command_with_timeout(["choco", "--version"], timeout=15)
             
             if return_code != 0:
                 return False, f"Chocolatey version check failed: {stderr}"
@@ -329,17 +350,28 @@ class ChocolateyManager:
         """
         Check internet connectivity for Chocolatey operations.
         
+        The result is reused for a minute, so back-to-back operations don't
+        each repeat the DNS lookups.
+        
         Returns:
             Tuple[bool, str]: (has_internet, message)
         """
+        now = time.monotonic()
+        if self._connectivity is not None and now - self._connectivity_time < self._connectivity_ttl:
+            return self._connectivity
+        
+        self._connectivity = self._probe_internet_connectivity()
+        self._connectivity_time = now
+        return self._connectivity
+    
+    def _probe_internet_connectivity(self) -> Tuple[bool, str]:
+        """Resolve the Chocolatey repository hosts to check connectivity."""
         test_hosts = [
             "chocolatey.org",
             "packages.chocolatey.org",
             "community.chocolatey.org"
         ]
         
-        import socket
-        
         for host in test_hosts:
             try:
                 # Test DNS resolution and basic connectivity
@@ -398,11 +430,9 @@ class ChocolateyManager:
             
             cmd_parts.append("--limit-output")
             
-            cmd = " ".join(cmd_parts)
-            
             # Execute search
             return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=PACKAGE_SEARCH_TIMEOUT
+                cmd_parts, timeout=PACKAGE_SEARCH_TIMEOUT
             )
             
             result.execution_time = time.time() - start_time
@@ -506,11 +536,9 @@ class ChocolateyManager:
             if ignore_checksums:
                 cmd_parts.append("--ignore-checksums")
             
-            cmd = " ".join(cmd_parts)
-            
             # Execute installation
             return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=CHOCOLATEY_INSTALL_TIMEOUT
+                cmd_parts, timeout=CHOCOLATEY_INSTALL_TIMEOUT
             )
             
             result.execution_time = time.time() - start_time
@@ -534,6 +562,29 @@ class ChocolateyManager:
         return result
 
 
+# Manager shared by searchers, installers and presets within a session
+_default_manager: Optional[ChocolateyManager] = None
+_default_manager_lock = threading.Lock()
+
+
+def get_default_manager() -> ChocolateyManager:
+    """
+    Get the process-wide Chocolatey manager, creating it on first use.
+    
+    Sharing one manager lets its cached availability, installed-package and
+    connectivity results be reused by every component.
+    
+    Returns:
+        ChocolateyManager: The shared manager
+    """
+    global _default_manager
+    if _default_manager is None:
+        with _default_manager_lock:
+            if _default_manager is None:
+                _default_manager = ChocolateyManager()
+    return _default_manager
+
+
 class ChocolateyInstallWorker(BaseWorker):
     """
     Worker class for installing Chocolatey package manager.
@@ -585,13 +636,17 @@ class ChocolateyInstallWorker(BaseWorker):
             
             # Execute installation command
             return_code, stdout, stderr = run_command_with_timeout(
-                " ".join(f'"{arg}"' if " " in arg else arg for arg in install_command),
-                timeout=CHOCOLATEY_INSTALL_TIMEOUT
+                install_command, timeout=CHOCOLATEY_INSTALL_TIMEOUT
             )
             
             if return_code == 0:
                 self.signals.emit_status("Chocolatey installation completed successfully")
                 
+                # Cached "not installed" results are stale now
+                get_default_manager().invalidate()
+                from .package_installer import invalidate_installer_cache
+                invalidate_installer_cache()
+                
                 # Verify installation
                 if self._verify_installation():
                     self.signals.emit_status("✓ Chocolatey installation verified")
@@ -616,7 +671,7 @@ class ChocolateyInstallWorker(BaseWorker):
     def _check_existing_installation(self) -> bool:
         """Check if Chocolatey is already installed."""
         try:
-            return_code, stdout, stderr = run_command_with_timeout("choco --version", timeout=10)
+            return_code, stdout, stderr = run_command_with_timeout(["choco", "--version"], timeout=10)
             return return_code == 0
         except:
             return False
@@ -628,7 +683,7 @@ class ChocolateyInstallWorker(BaseWorker):
             time.sleep(2)
             
             # Test basic Chocolatey command
-            return_code, stdout, stderr = run_command_with_timeout("choco --version", timeout=15)
+            return_code, stdout, stderr = run_command_with_timeout(["choco", "--version"], timeout=15)
             
             if return_code == 0 and stdout.strip():
                 self.signals.emit_status(f"Chocolatey version: {stdout.strip()}")
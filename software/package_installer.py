@@ -6,19 +6,53 @@ including batch installations, progress tracking, verification, and detailed
 error reporting.
 """
 
+import os
+import re
+import asyncio
+import shlex
 import subprocess
 import time
 import logging
 import shutil
-from typing import List, Dict, Tuple, Optional, Any
-from dataclasses import dataclass, field
+import sqlite3
+import hashlib
+import threading
+import itertools
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import closing, nullcontext
+from typing import List, Dict, Set, Sequence, Mapping, Tuple, Optional, Any, Union, Callable, Final
+from types import MappingProxyType
+from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+# Optional C-backed multi-pattern matcher for installer output scanning
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Import core utilities - handle missing imports gracefully
 try:
-    from core import BaseWorker, run_command_with_timeout, check_admin_privileges
+    from core import (
+        BaseWorker,
+        run_command_with_timeout,
+        check_admin_privileges,
+        PACKAGE_CACHE_DIR_NAME,
+        PACKAGE_CACHE_TTL_HOURS,
+        PACKAGE_CACHE_SOURCE_NAME,
+        PACKAGE_SEARCH_TIMEOUT,
+        MAX_CONCURRENT_INSTALLATIONS
+    )
 except ImportError:
+    MAX_CONCURRENT_INSTALLATIONS = 3
+    PACKAGE_SEARCH_TIMEOUT = 15
+    PACKAGE_CACHE_DIR_NAME = "choco_cache"
+    PACKAGE_CACHE_TTL_HOURS = 24
+    PACKAGE_CACHE_SOURCE_NAME = "it-admin-tool-cache"
+    
     # Fallback implementations if core module isn't available
     class BaseWorker:
         def __init__(self):
@@ -27,12 +61,12 @@ except ImportError:
         def should_stop(self):
             return self.should_stop_flag
     
-    def run_command_with_timeout(cmd: str, timeout: int = 300) -> Tuple[int, str, str]:
+    def run_command_with_timeout(cmd: Union[str, List[str]], timeout: int = 300) -> Tuple[int, str, str]:
         """Fallback command runner with timeout."""
         try:
             result = subprocess.run(
                 cmd, 
-                shell=True, 
+                shell=isinstance(cmd, str), 
                 capture_output=True, 
                 text=True, 
                 timeout=timeout
@@ -52,6 +86,669 @@ except ImportError:
             return False
 
 
+# Chocolatey manager classes, resolved once at import (None if unavailable)
+try:
+    from software.chocolatey_manager import ChocolateyManager as _ChocolateyManagerCls
+    from software.chocolatey_manager import get_default_manager as _get_default_manager
+except ImportError:
+    _ChocolateyManagerCls = None
+    _get_default_manager = None
+
+try:
+    from software.chocolatey_manager import EnhancedChocolateyManager as _EnhancedChocolateyManagerCls
+except ImportError:
+    _EnhancedChocolateyManagerCls = None
+
+
+# Held around choco runs that must not overlap (e.g. MSI-based installers,
+# which fail while another Windows Installer transaction is in progress)
+_INSTALL_LOCK = threading.Lock()
+
+# Availability probes are network-bound choco searches, run this many at once
+PROBE_WORKERS = 8
+
+# Chocolatey PATH lookups (used when no manager is available) are reused this long
+CHOCO_AVAILABILITY_TTL = 60  # seconds
+
+# Admin status cannot change during the process lifetime, so check it once
+ADMIN_AVAILABLE = check_admin_privileges()
+
+# Disk usage results are reused for a few seconds
+DISK_USAGE_TTL = 5.0  # seconds
+_disk_usage_cache: Dict[str, Tuple[float, Any]] = {}
+_disk_usage_lock = threading.Lock()
+
+
+def _cached_disk_usage(path: str = '.') -> Any:
+    """
+    Get shutil.disk_usage for a path, reusing results younger than DISK_USAGE_TTL.
+    
+    Workers starting together wait on one probe instead of each querying
+    the filesystem.
+    """
+    with _disk_usage_lock:
+        now = time.monotonic()
+        cached = _disk_usage_cache.get(path)
+        if cached is not None and now - cached[0] < DISK_USAGE_TTL:
+            return cached[1]
+        
+        usage = shutil.disk_usage(path)
+        _disk_usage_cache[path] = (now, usage)
+        return usage
+
+
+# Successful "choco --version" results are shared by workers for a minute
+PREREQ_CACHE_TTL = 60.0  # seconds
+_CHOCO_VERSION_CACHE: Tuple[float, Optional[str]] = (0.0, None)
+
+
+def _cached_choco_version(ttl: float = PREREQ_CACHE_TTL) -> Tuple[int, str, str]:
+    """
+    Run "choco --version", reusing a successful result younger than ttl.
+    
+    Returns:
+        Tuple[int, str, str]: (return_code, version, stderr)
+    """
+    global _CHOCO_VERSION_CACHE
+    
+    checked_at, version = _CHOCO_VERSION_CACHE
+    if version is not None and time.monotonic() - checked_at < ttl:
+        return 0, version, ""
+    
+    return_code, stdout, stderr = run_command_with_timeout(
+        [_choco_executable(), "--version"], timeout=10
+    )
+    if return_code == 0:
+        _CHOCO_VERSION_CACHE = (time.monotonic(), stdout.strip())
+    return return_code, stdout.strip(), stderr
+
+
+def invalidate_prereq_cache() -> None:
+    """Forget cached pre-installation check results."""
+    global _CHOCO_VERSION_CACHE
+    _CHOCO_VERSION_CACHE = (0.0, None)
+    with _disk_usage_lock:
+        _disk_usage_cache.clear()
+
+
+@functools.lru_cache(maxsize=1)
+def _choco_executable() -> str:
+    """Resolve the choco executable path once, so runs skip the PATH search."""
+    return shutil.which("choco") or "choco"
+
+
+@functools.lru_cache(maxsize=32)
+def _installation_requirements(packages: Tuple[str, ...], chocolatey_available: bool) -> Dict[str, Any]:
+    """Compute installation requirements for a sorted package tuple."""
+    return {
+        'package_count': len(packages),
+        'estimated_time_minutes': len(packages) * 3,
+        'admin_required': True,
+        'admin_available': ADMIN_AVAILABLE,
+        'internet_required': True,
+        'chocolatey_available': chocolatey_available,
+        'disk_space_estimate_mb': len(packages) * 75
+    }
+
+
+# Packages passed to a single choco install run when installing in batches
+INSTALL_BATCH_SIZE = 8
+
+# Number of trailing output lines kept per streamed choco run
+OUTPUT_TAIL_LINES = 256
+
+# How often a running choco checks for cancellation, and how long it gets
+# to exit after being asked before it is killed
+CANCEL_POLL_INTERVAL = 0.2  # seconds
+CANCEL_GRACE_PERIOD = 5.0  # seconds
+
+
+def _terminate_process_tree(proc: subprocess.Popen, force: bool = False) -> None:
+    """Stop a process together with the installers it spawned."""
+    if os.name == 'nt':
+        # choco runs installers as child processes; /T takes them down too
+        args = ["taskkill", "/PID", str(proc.pid), "/T"] + (["/F"] if force else [])
+        subprocess.run(args, capture_output=True)
+    elif force:
+        proc.kill()
+    else:
+        proc.terminate()
+
+
+def _run_streaming_command(
+    cmd: Sequence[str],
+    timeout: int,
+    on_line: Optional[Callable[[str], None]] = None,
+    tail_lines: int = OUTPUT_TAIL_LINES,
+    should_stop: Optional[Callable[[], bool]] = None
+) -> Tuple[int, str, str]:
+    """
+    Run a command, streaming its stdout lines as they arrive.
+    
+    Only the last tail_lines lines of each stream are kept, so memory stays
+    bounded regardless of how much a choco run logs. Result markers always
+    appear near the end of the output, so the tail is enough for analysis.
+    
+    Args:
+        cmd: Command tokens (run without a shell)
+        timeout: Timeout in seconds
+        on_line: Called with each stdout line (without the newline)
+        tail_lines: Number of trailing lines kept per stream
+        should_stop: Polled while the command runs; the process tree is
+            terminated once it returns True
+    
+    Returns:
+        Tuple[int, str, str]: (return_code, stdout_tail, stderr_tail)
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command times out
+    """
+    proc = subprocess.Popen(
+        list(cmd),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors='replace',
+        bufsize=1
+    )
+    
+    stdout_tail = deque(maxlen=tail_lines)
+    stderr_tail = deque(maxlen=tail_lines)
+    timed_out = threading.Event()
+    
+    def kill_on_timeout() -> None:
+        timed_out.set()
+        proc.kill()
+    
+    # Drain stderr separately so a full pipe can never block the process
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_tail.extend(line.rstrip('\r\n') for line in proc.stderr),
+        daemon=True
+    )
+    watchdog = threading.Timer(timeout, kill_on_timeout)
+    finished = threading.Event()
+    
+    def stop_on_cancel() -> None:
+        while not finished.wait(CANCEL_POLL_INTERVAL):
+            if should_stop():
+                _terminate_process_tree(proc)
+                try:
+                    proc.wait(CANCEL_GRACE_PERIOD)
+                except subprocess.TimeoutExpired:
+                    _terminate_process_tree(proc, force=True)
+                return
+    
+    stderr_reader.start()
+    watchdog.start()
+    if should_stop is not None:
+        threading.Thread(target=stop_on_cancel, daemon=True).start()
+    
+    try:
+        for line in proc.stdout:
+            line = line.rstrip('\r\n')
+            stdout_tail.append(line)
+            if on_line is not None:
+                on_line(line)
+        proc.wait()
+        stderr_reader.join()
+    finally:
+        finished.set()
+        watchdog.cancel()
+        proc.stdout.close()
+        proc.stderr.close()
+    
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(list(cmd), timeout)
+    
+    return proc.returncode, '\n'.join(stdout_tail), '\n'.join(stderr_tail)
+
+
+# Output indicators used to classify choco install results
+SUCCESS_INDICATORS = (
+    'successfully installed',
+    'installation was successful',
+    'chocolatey installed',
+    'package files install completed'
+)
+
+FAILURE_INDICATORS = (
+    'failed',
+    'error occurred',
+    'access denied',
+    'not found',
+    'unable to',
+    'installation failed',
+    'package was not found',
+    'chocolatey failed',
+    'execution failed'
+)
+
+WARNING_INDICATORS = (
+    'warning',
+    'deprecated',
+    'outdated',
+    'checksum validation',
+    'unable to verify'
+)
+
+
+# Human-readable meanings of Chocolatey return codes
+_CHOCO_ERROR_CODES: Final[Mapping[int, str]] = MappingProxyType({
+    1: "General error or unspecified failure",
+    2: "File not found or package not found",
+    3: "Invalid arguments or configuration error",
+    4: "Access denied or permission error",
+    5: "Network error or download failure",
+    48: "Package installation cancelled by user",
+    1618: "Another installation is already in progress",
+    1641: "Installation successful but restart required",
+    3010: "Installation successful but restart required"
+})
+
+# Chocolatey return codes for failures that retrying cannot fix (2: package
+# not found, 3: invalid arguments, 4: access denied, 48: cancelled by user)
+_FATAL_CODES = frozenset({2, 3, 4, 48})
+
+# Return codes for failures likely to clear up on their own (5: network or
+# download failure, 1: generic failure, -1: timeout or no return code,
+# 1618: another Windows Installer transaction is in progress)
+_TRANSIENT_CODES = frozenset({5, 1, -1, 1618})
+
+# Retry delays: fixed for other failures, exponential (capped) for transient ones
+RETRY_DELAY = 2  # seconds
+RETRY_BACKOFF_MAX = 30  # seconds
+
+# Chocolatey return codes for successful installs that need a reboot
+_RESTART_REQUIRED_CODES = frozenset({1641, 3010})
+
+# Message fragments for terminal failures that carry no return code
+_NO_RETRY_MESSAGES = (
+    'package name cannot be empty',
+    'chocolatey is not installed',
+    'not found',
+    'access denied',
+    'cancelled'
+)
+
+@functools.lru_cache(maxsize=128)
+def _indicator_pattern(indicators: Tuple[str, ...]) -> re.Pattern:
+    """
+    Compile a case-insensitive alternation of the indicators.
+    
+    Cached, so per-package phrase sets are compiled once per package
+    rather than on every scan.
+    """
+    return re.compile('|'.join(map(re.escape, indicators)), re.IGNORECASE)
+
+
+# Precompiled indicator alternations, matched against output as-is
+_SUCCESS_RE = _indicator_pattern(SUCCESS_INDICATORS)
+_FAILURE_RE = _indicator_pattern(FAILURE_INDICATORS)
+_WARNING_RE = _indicator_pattern(WARNING_INDICATORS)
+
+
+# Keywords marking stderr lines worth showing in per-package reports
+_ERROR_LINE_RE = re.compile(r'error|failed|exception', re.IGNORECASE)
+
+
+def _tail_matching_lines(text: str, pattern: re.Pattern, count: int = 2) -> List[str]:
+    """
+    Get the last lines of text matching a pattern, scanning backwards.
+    
+    Only the tail of the text is visited, so work stops as soon as enough
+    matches are found regardless of the total output size.
+    """
+    matches = []
+    end = len(text)
+    
+    while end > 0 and len(matches) < count:
+        start = text.rfind('\n', 0, end) + 1
+        line = text[start:end].strip()
+        if line and pattern.search(line):
+            matches.append(line)
+        end = start - 1
+    
+    matches.reverse()
+    return matches
+
+
+def _last_line(text: str, window: int = 4096) -> str:
+    """Get the last non-empty line of text, looking only at its tail."""
+    tail = text[-window:].rstrip()
+    return tail.rpartition('\n')[2].strip()
+
+
+# Number of trailing stderr error lines kept on failed results
+RELEVANT_ERROR_LINES = 5
+
+
+def _relevant_error_lines(stderr: str) -> Tuple[str, ...]:
+    """Get the last stderr lines mentioning an error, failure or exception."""
+    return tuple(_tail_matching_lines(stderr, _ERROR_LINE_RE, RELEVANT_ERROR_LINES))
+
+
+def _extract_failure_lines(stdout: str, stderr: str, limit: int = 3) -> List[str]:
+    """Get the first lines across stdout and stderr that mention a failure."""
+    error_lines = []
+    for line in itertools.chain(stdout.splitlines(), stderr.splitlines()):
+        if _FAILURE_RE.search(line):
+            error_lines.append(line.strip())
+            if len(error_lines) >= limit:
+                break
+    return error_lines
+
+
+# Trailing characters of each stream scanned for result indicators
+ANALYSIS_STDOUT_WINDOW = 4096
+ANALYSIS_STDERR_WINDOW = 2048
+
+
+# Indicator kinds with their indicators and precompiled patterns
+_INDICATOR_KINDS: Mapping[str, Tuple[Tuple[str, ...], re.Pattern]] = MappingProxyType({
+    'success': (SUCCESS_INDICATORS, _SUCCESS_RE),
+    'failure': (FAILURE_INDICATORS, _FAILURE_RE),
+    'warning': (WARNING_INDICATORS, _WARNING_RE)
+})
+
+
+def _build_automaton() -> Optional[Any]:
+    """Build one Aho-Corasick automaton over all indicator kinds, if available."""
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for kind, (indicators, _) in _INDICATOR_KINDS.items():
+        for indicator in indicators:
+            automaton.add_word(indicator, (kind, indicator))
+    automaton.make_automaton()
+    return automaton
+
+
+INDICATOR_AC = _build_automaton()
+
+
+def _scan_indicators(
+    text: str,
+    extra_success: Tuple[str, ...] = (),
+    success_end: Optional[int] = None
+) -> Dict[str, Set[str]]:
+    """
+    Get the (lowercased) indicators found in text, grouped by kind.
+    
+    With pyahocorasick, every kind is found in a single pass over one
+    lowercased copy of the text, and the extra (lowercase) success phrases
+    are checked against that same copy. Otherwise each kind's
+    case-insensitive pattern runs on the text directly; success and failure
+    patterns stop at the first hit, since only their presence matters.
+    
+    If success_end is given, success indicators only count when they end
+    before that offset, so callers can scan stdout and stderr joined
+    together while taking success from stdout alone.
+    """
+    if success_end is None:
+        success_end = len(text)
+    found: Dict[str, Set[str]] = {kind: set() for kind in _INDICATOR_KINDS}
+    
+    if INDICATOR_AC is not None:
+        lowered = text.lower()
+        for end, (kind, indicator) in INDICATOR_AC.iter(lowered):
+            if kind != 'success' or end < success_end:
+                found[kind].add(indicator)
+        found['success'].update(
+            phrase for phrase in extra_success if lowered.find(phrase, 0, success_end) != -1
+        )
+        return found
+    
+    match = _SUCCESS_RE.search(text, 0, success_end)
+    if match:
+        found['success'].add(match.group().lower())
+    match = _FAILURE_RE.search(text)
+    if match:
+        found['failure'].add(match.group().lower())
+    if not found['success'] and extra_success:
+        found['success'].update(
+            match.group().lower()
+            for match in _indicator_pattern(extra_success).finditer(text, 0, success_end)
+        )
+    found['warning'].update(match.group().lower() for match in _WARNING_RE.finditer(text))
+    return found
+
+
+# Package header choco prints before each package's log, e.g. "git v2.43.0 [Approved]"
+_PACKAGE_HEADER_RE = re.compile(r'^(?P<name>\S+) v\d[\w.\-]*(?: \[Approved\])?', re.MULTILINE)
+
+# Heading of the failure summary choco prints after multi-package runs, and
+# its entries (the "Warnings:" summary uses the same entry format)
+_FAILURES_HEADING_RE = re.compile(r'^Failures:?[ \t]*\r?$', re.MULTILINE)
+_FAILED_PACKAGE_RE = re.compile(r' - (?P<name>\S+)(?: \(exited (?P<code>-?\d+)\))? - ')
+
+
+def _failed_package_codes(output: str) -> Dict[str, int]:
+    """
+    Get the return code of each package in choco's "Failures" summary.
+    
+    Only entries under the Failures heading count, up to the next blank
+    line or heading; packages listed under "Warnings:" did not fail.
+    
+    >>> _failed_package_codes(
+    ...     "Warnings:\\n - git - git v2.40 already installed.\\n\\n"
+    ...     "Failures\\n - vlc (exited 1603) - Error while running installer\\n"
+    ...     " - bad - bad not installed. The package was not found.\\n"
+    ... )
+    {'vlc': 1603, 'bad': 1}
+    """
+    codes: Dict[str, int] = {}
+    headings = list(_FAILURES_HEADING_RE.finditer(output))
+    if not headings:
+        return codes
+    
+    for line in output[headings[-1].end():].lstrip('\r\n').splitlines():
+        if not line.strip() or not line[0].isspace():
+            break
+        match = _FAILED_PACKAGE_RE.match(line)
+        if match:
+            codes[match.group('name').lower()] = int(match.group('code') or 1)
+    
+    return codes
+
+
+def _package_name_pattern(package: str) -> str:
+    """
+    Get a regex matching a package name only as a whole name.
+    
+    Package ids may contain '.', '-' and '_', so "git" must not match inside
+    "github-desktop" or "git.install"; a trailing sentence period is allowed.
+    """
+    return rf'(?<![\w.\-]){re.escape(package)}(?![\w\-]|\.\w)'
+
+
+def _split_batch_output(output: str, packages: Sequence[str]) -> Dict[str, str]:
+    """
+    Split a multi-package choco log into per-package sections.
+    
+    Each section runs from a package header line through its "The install
+    of <name>" result line (or up to the next header). Packages without a
+    header (e.g. not found in any source) get the lines mentioning them.
+    """
+    by_lower = {package.lower(): package for package in packages}
+    sections: Dict[str, str] = {}
+    
+    headers = [
+        match for match in _PACKAGE_HEADER_RE.finditer(output)
+        if match.group('name').lower() in by_lower
+    ]
+    for match, next_match in zip(headers, headers[1:] + [None]):
+        end = next_match.start() if next_match else len(output)
+        package = by_lower[match.group('name').lower()]
+        result_line = re.compile(rf'^ ?The install of {_package_name_pattern(package)}.*$', re.I | re.M)
+        result_match = result_line.search(output, match.start(), end)
+        if result_match:
+            end = result_match.end()
+        sections[package] = sections.get(package, '') + output[match.start():end]
+    
+    for package in packages:
+        if package not in sections:
+            mention = re.compile(_package_name_pattern(package), re.IGNORECASE)
+            sections[package] = '\n'.join(
+                line for line in output.splitlines() if mention.search(line)
+            )
+    
+    return sections
+
+
+def _reported_successful(output: str, package: str) -> bool:
+    """Check whether choco's log reports the package's install as successful."""
+    return re.search(
+        rf'^ ?The install of {_package_name_pattern(package)} was successful',
+        output, re.IGNORECASE | re.MULTILINE
+    ) is not None
+
+
+# Splits a nupkg file stem such as "7zip.install.23.1.0" into name and version
+NUPKG_STEM_PATTERN = re.compile(r'^(?P<name>.+?)\.(?P<version>\d+(?:\.[^.]+)*)$')
+
+
+def _file_sha256(path: Path) -> str:
+    """Compute the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class PackageCacheIndex:
+    """
+    SQLite index of Chocolatey packages downloaded to a local cache directory.
+    
+    Entries are keyed on (name, version) and store the nupkg path with its
+    SHA-256 digest, size and modification time. The digest is computed when
+    a file is indexed; lookups only compare size and mtime, so modified or
+    expired files are never reused without re-reading every nupkg.
+    """
+    
+    def __init__(self, cache_dir: Path, ttl_hours: int = PACKAGE_CACHE_TTL_HOURS):
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_hours * 3600
+        self.db_path = cache_dir / "index.db"
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, creating (or upgrading) it if needed."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(packages)")}
+        if columns and 'size' not in columns:
+            # Indexes from before size/mtime tracking are rebuilt on the next scan
+            conn.execute("DROP TABLE packages")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS packages ("
+            "name TEXT NOT NULL, version TEXT NOT NULL, "
+            "path TEXT NOT NULL, sha256 TEXT NOT NULL, "
+            "size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, "
+            "PRIMARY KEY (name, version))"
+        )
+        return conn
+    
+    def is_cached(self, package_name: str) -> bool:
+        """Check if a fresh, unmodified nupkg exists for the package."""
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT path, size, mtime_ns FROM packages WHERE name = ?",
+                    (package_name.lower(),)
+                ).fetchall()
+        except sqlite3.Error:
+            return False
+        
+        now = time.time()
+        for path_str, size, mtime_ns in rows:
+            try:
+                stat = Path(path_str).stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.ttl_seconds:
+                continue
+            if stat.st_size == size and stat.st_mtime_ns == mtime_ns:
+                return True
+        
+        return False
+    
+    def prune_expired(self) -> int:
+        """
+        Delete nupkgs older than the TTL, and index entries for missing files.
+        
+        Returns:
+            int: Number of deleted files
+        """
+        now = time.time()
+        removed = 0
+        for path in self.cache_dir.glob("*.nupkg"):
+            try:
+                if now - path.stat().st_mtime > self.ttl_seconds:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        
+        try:
+            with closing(self._connect()) as conn, conn:
+                stale = [
+                    (path,) for (path,) in conn.execute("SELECT path FROM packages")
+                    if not Path(path).exists()
+                ]
+                conn.executemany("DELETE FROM packages WHERE path = ?", stale)
+        except sqlite3.Error as e:
+            logging.debug(f"Package cache index prune failed: {e}")
+        
+        return removed
+    
+    def index_directory(self) -> int:
+        """
+        Record every nupkg in the cache directory in the index.
+        
+        Files whose size and mtime match their existing entry keep its
+        digest; only new or changed files are hashed.
+        
+        Returns:
+            int: Number of indexed packages
+        """
+        with closing(self._connect()) as conn:
+            known = {
+                path: (size, mtime_ns, sha256)
+                for path, size, mtime_ns, sha256 in conn.execute(
+                    "SELECT path, size, mtime_ns, sha256 FROM packages"
+                )
+            }
+        
+        entries = []
+        for path in self.cache_dir.glob("*.nupkg"):
+            match = NUPKG_STEM_PATTERN.match(path.stem)
+            if not match:
+                continue
+            try:
+                stat = path.stat()
+                size, mtime_ns, sha256 = known.get(str(path), (None, None, None))
+                if (size, mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+                    sha256 = _file_sha256(path)
+                entries.append((
+                    match.group('name').lower(),
+                    match.group('version'),
+                    str(path),
+                    sha256,
+                    stat.st_size,
+                    stat.st_mtime_ns
+                ))
+            except OSError:
+                continue
+        
+        with closing(self._connect()) as conn, conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO packages VALUES (?, ?, ?, ?, ?, ?)", entries
+            )
+        
+        return len(entries)
+
+
 class InstallationStatus(Enum):
     """Package installation status enumeration."""
     PENDING = "pending"
@@ -61,7 +758,7 @@ class InstallationStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageInstallResult:
     """Enhanced result of a package installation attempt."""
     package_name: str
@@ -71,8 +768,19 @@ class PackageInstallResult:
     install_time: Optional[float] = None
     output: str = ""
     error_output: str = ""
-    command_used: str = ""
-    warnings: List[str] = field(default_factory=list)
+    command_used: Tuple[str, ...] = ()
+    warnings: Sequence[str] = ()
+    relevant_error_lines: Sequence[str] = ()
+    
+    @classmethod
+    def success(cls, package_name: str, message: str, **kwargs: Any) -> 'PackageInstallResult':
+        """Create a successful installation result."""
+        return cls(package_name, InstallationStatus.SUCCESS, message, **kwargs)
+    
+    @classmethod
+    def failure(cls, package_name: str, message: str, **kwargs: Any) -> 'PackageInstallResult':
+        """Create a failed installation result."""
+        return cls(package_name, InstallationStatus.FAILED, message, **kwargs)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary for serialization."""
@@ -82,7 +790,7 @@ class PackageInstallResult:
             'message': self.message,
             'return_code': self.return_code,
             'install_time': self.install_time,
-            'success': self.status == InstallationStatus.SUCCESS,
+            'success': self.status is InstallationStatus.SUCCESS,
             'warnings_count': len(self.warnings)
         }
 
@@ -95,23 +803,171 @@ class PackageInstaller:
     managing installations with standard error handling.
     """
     
-    def __init__(self):
-        # Import here to avoid circular imports
-        self.chocolatey_manager = None
-        try:
-            from software.chocolatey_manager import ChocolateyManager
-            self.chocolatey_manager = ChocolateyManager()
-        except ImportError:
-            # Chocolatey manager not available - we'll check manually
-            pass
+    # Manager class used by this installer, and its instance shared by all
+    # installers of the class (the manager holds no per-install state)
+    _manager_cls = _ChocolateyManagerCls
+    _shared_manager = None
+    
+    @classmethod
+    def _get_shared_manager(cls) -> Optional[Any]:
+        """Get the shared Chocolatey manager, creating it on first use."""
+        if cls._shared_manager is None and cls._manager_cls is not None:
+            if cls._manager_cls is _ChocolateyManagerCls:
+                # Plain managers are shared with searchers and presets too
+                cls._shared_manager = _get_default_manager()
+            else:
+                cls._shared_manager = cls._manager_cls()
+        return cls._shared_manager
+    
+    def __init__(self, manager: Optional[Any] = None):
+        # Local nupkg cache used as a preferred install source
+        local_app_data = os.environ.get('LOCALAPPDATA') or str(Path.home())
+        self.cache_dir = Path(local_app_data) / PACKAGE_CACHE_DIR_NAME
+        self.cache_index = PackageCacheIndex(self.cache_dir)
+        
+        # Enabled choco source names, listed on first cached install
+        self._sources: Optional[Tuple[str, ...]] = None
+        self._sources_lock = threading.Lock()
+        
+        # Cached PATH lookup for Chocolatey when there is no manager, and when it was made
+        self._choco_available: Optional[bool] = None
+        self._choco_checked_at = 0.0
+        
+        # Injected or shared manager, or None if unavailable - we'll check manually
+        self.chocolatey_manager = manager or self._get_shared_manager()
     
     def is_chocolatey_available(self) -> bool:
-        """Check if Chocolatey is available on the system."""
+        """
+        Check if Chocolatey is available on the system.
+        
+        The manager caches its own result for a short TTL; without a manager,
+        the PATH lookup is cached for CHOCO_AVAILABILITY_TTL seconds, so a
+        Chocolatey installed mid-session is picked up without a restart.
+        """
         if self.chocolatey_manager:
             return self.chocolatey_manager.is_chocolatey_installed()
         
         # Manual check if manager not available
-        return shutil.which("choco") is not None
+        now = time.monotonic()
+        if self._choco_available is None or now - self._choco_checked_at >= CHOCO_AVAILABILITY_TTL:
+            self._choco_available = shutil.which("choco") is not None
+            self._choco_checked_at = now
+        
+        return self._choco_available
+    
+    def invalidate_chocolatey_cache(self) -> None:
+        """Forget cached Chocolatey availability and sources (e.g. after installing Chocolatey)."""
+        self._choco_available = None
+        self._sources = None
+        _choco_executable.cache_clear()
+        if self.chocolatey_manager:
+            self.chocolatey_manager.invalidate()
+    
+    def _ensure_local_cache(self, packages: List[str], timeout: int = 600) -> List[str]:
+        """
+        Download packages that are not yet cached into the local cache directory.
+        
+        Uses a single "choco download" run for all missing packages. Download
+        requires a licensed Chocolatey edition; on failure the cache is simply
+        left as is and installs fall back to the configured sources. Expired
+        nupkgs are deleted first, so the cache never serves stale packages.
+        
+        Args:
+            packages: List of package names
+            timeout: Download timeout in seconds
+        
+        Returns:
+            List[str]: Package names available from the local cache
+        """
+        self.cache_index.prune_expired()
+        
+        names = list(dict.fromkeys(p.strip().lower() for p in packages if p and p.strip()))
+        missing = [name for name in names if not self.cache_index.is_cached(name)]
+        
+        if missing:
+            cmd_parts = [_choco_executable(), "download"] + missing + [
+                f"--output-directory={self.cache_dir}", "-y"
+            ]
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                return_code, stdout, stderr = run_command_with_timeout(
+                    cmd_parts, timeout=timeout
+                )
+                if return_code == 0:
+                    self.cache_index.index_directory()
+                else:
+                    logging.debug(f"Package cache download failed: {stderr.strip()}")
+            except Exception as e:
+                logging.debug(f"Package cache download error: {e}")
+        
+        return [name for name in names if self.cache_index.is_cached(name)]
+    
+    def _configured_sources(self) -> Optional[Tuple[str, ...]]:
+        """
+        Get the names of the enabled choco sources, listed once per installer.
+        
+        A cache source left registered by earlier versions is removed here,
+        so it no longer takes priority in choco runs outside this app.
+        
+        Returns:
+            Optional[Tuple[str, ...]]: Source names, or None if they can't be listed
+        """
+        with self._sources_lock:
+            if self._sources is not None:
+                return self._sources
+            
+            try:
+                return_code, stdout, stderr = run_command_with_timeout(
+                    [_choco_executable(), "source", "list", "--limit-output"], timeout=30
+                )
+            except Exception as e:
+                logging.debug(f"Choco source listing error: {e}")
+                return None
+            if return_code != 0:
+                logging.debug(f"Choco source listing failed: {stderr.strip()}")
+                return None
+            
+            # Lines are "name|url|disabled|user|certificate|priority|..."
+            names = []
+            for line in stdout.splitlines():
+                fields = line.split('|')
+                if len(fields) < 3:
+                    continue
+                name = fields[0].strip()
+                if name.lower() == PACKAGE_CACHE_SOURCE_NAME.lower():
+                    self._remove_legacy_cache_source()
+                elif fields[2].strip().lower() != 'true':
+                    names.append(name)
+            
+            self._sources = tuple(names)
+            return self._sources
+    
+    @staticmethod
+    def _remove_legacy_cache_source() -> None:
+        """Unregister the machine-wide cache source added by earlier versions."""
+        try:
+            run_command_with_timeout(
+                [_choco_executable(), "source", "remove", f"--name={PACKAGE_CACHE_SOURCE_NAME}"],
+                timeout=30
+            )
+        except Exception as e:
+            logging.debug(f"Legacy cache source removal error: {e}")
+    
+    def _cache_source_args(self, package_name: str) -> List[str]:
+        """
+        Get --source arguments preferring the local cache, if it holds the package.
+        
+        The cache is listed first, followed by the user's configured sources
+        by name (so internal or proxy feeds and their credentials still
+        apply), for this run only. If the sources can't be listed, the
+        cache is not used rather than replacing them.
+        """
+        if not self.cache_index.is_cached(package_name):
+            return []
+        sources = self._configured_sources()
+        if sources is None:
+            return []
+        return [f"--source={';'.join((str(self.cache_dir),) + sources)}"]
     
     def install_package(
         self, 
@@ -131,9 +987,8 @@ class PackageInstaller:
             PackageInstallResult: Installation result
         """
         if not package_name or not package_name.strip():
-            return PackageInstallResult(
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message="Package name cannot be empty"
             )
         
@@ -142,34 +997,34 @@ class PackageInstaller:
         
         # Check if Chocolatey is available
         if not self.is_chocolatey_available():
-            return PackageInstallResult(
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message="Chocolatey is not installed or not available in PATH"
             )
         
         # Build command
-        cmd_parts = ["choco", "install", package_name, "-y"]
+        cmd_parts = [_choco_executable(), "install", package_name, "-y"]
         
         if force:
             cmd_parts.append("--force")
         
-        cmd = " ".join(cmd_parts)
+        cmd_parts.extend(self._cache_source_args(package_name))
+        cmd = tuple(cmd_parts)
         
         try:
-            return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=timeout
-            )
+            return_code, stdout, stderr = _run_streaming_command(cmd, timeout)
             
             install_time = time.time() - start_time
             
             # Simple success check
-            success = return_code == 0 and "successfully installed" in stdout.lower()
+            success = (
+                (return_code == 0 and "successfully installed" in stdout.lower()) or
+                return_code in _RESTART_REQUIRED_CODES
+            )
             
             if success:
-                return PackageInstallResult(
+                return PackageInstallResult.success(
                     package_name=package_name,
-                    status=InstallationStatus.SUCCESS,
                     message=f"Successfully installed {package_name}",
                     return_code=return_code,
                     install_time=install_time,
@@ -179,9 +1034,8 @@ class PackageInstaller:
                 )
             else:
                 error_msg = stderr.strip() if stderr.strip() else "Installation failed"
-                return PackageInstallResult(
+                return PackageInstallResult.failure(
                     package_name=package_name,
-                    status=InstallationStatus.FAILED,
                     message=f"Installation failed: {error_msg}",
                     return_code=return_code,
                     install_time=install_time,
@@ -192,9 +1046,8 @@ class PackageInstaller:
                 
         except subprocess.TimeoutExpired:
             install_time = time.time() - start_time
-            return PackageInstallResult(
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message=f"Installation timed out after {timeout} seconds",
                 install_time=install_time,
                 error_output="Installation timeout",
@@ -202,15 +1055,89 @@ class PackageInstaller:
             )
         except Exception as e:
             install_time = time.time() - start_time
-            return PackageInstallResult(
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message=f"Installation error: {str(e)}",
                 install_time=install_time,
                 error_output=str(e),
                 command_used=cmd
             )
     
+    def probe_packages(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Quickly check which packages exist in the Chocolatey repository.
+        
+        Runs a lightweight exact-match search per package, up to
+        PROBE_WORKERS at a time, so that unknown names can be skipped before
+        a full install attempt. Packages whose probe fails (timeout, network
+        error) are reported as available.
+        
+        Args:
+            packages: List of package names
+        
+        Returns:
+            Dict[str, bool]: Availability keyed by package name
+        """
+        if not packages:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(packages))) as executor:
+            return dict(zip(packages, executor.map(self._probe_package, packages)))
+    
+    @staticmethod
+    def _probe_package(package: str) -> bool:
+        """Check whether one package exists (True if the probe itself fails)."""
+        package_name = package.strip()
+        try:
+            return_code, stdout, stderr = run_command_with_timeout(
+                [_choco_executable(), "search", package_name, "--exact", "--limit-output"],
+                timeout=PACKAGE_SEARCH_TIMEOUT
+            )
+        except Exception:
+            return True
+        
+        if return_code != 0:
+            return True
+        
+        package_lower = package_name.lower()
+        return any(
+            line.split('|', 1)[0].strip().lower() == package_lower
+            for line in stdout.splitlines()
+        )
+    
+    def get_installed_packages(self, choco_version: str = "") -> Set[str]:
+        """
+        Get the lowercased names of locally installed packages.
+        
+        Uses a single "choco list" run. Chocolatey 2 lists local packages by
+        default and rejects the older --local-only flag.
+        
+        Args:
+            choco_version: Chocolatey version string, if already known
+        
+        Returns:
+            Set[str]: Installed package names (empty if listing fails)
+        """
+        cmd = [_choco_executable(), "list", "--limit-output"]
+        major = choco_version.split('.', 1)[0]
+        if not (major.isdigit() and int(major) >= 2):
+            cmd.append("--local-only")
+        
+        try:
+            return_code, stdout, stderr = run_command_with_timeout(cmd, timeout=30)
+        except Exception as e:
+            logging.debug(f"Installed package listing error: {e}")
+            return set()
+        
+        if return_code != 0:
+            logging.debug(f"Installed package listing failed: {stderr.strip()}")
+            return set()
+        
+        return {
+            line.split('|', 1)[0].strip().lower()
+            for line in stdout.splitlines() if '|' in line
+        }
+    
     def get_installation_requirements(self, packages: List[str]) -> Dict[str, Any]:
         """
         Get installation requirements for a list of packages.
@@ -221,15 +1148,10 @@ class PackageInstaller:
         Returns:
             Dict: Installation requirements and estimates
         """
-        return {
-            'package_count': len(packages),
-            'estimated_time_minutes': len(packages) * 3,
-            'admin_required': True,
-            'admin_available': check_admin_privileges(),
-            'internet_required': True,
-            'chocolatey_available': self.is_chocolatey_available(),
-            'disk_space_estimate_mb': len(packages) * 75
-        }
+        requirements = _installation_requirements(
+            tuple(sorted(packages)), self.is_chocolatey_available()
+        )
+        return dict(requirements)
 
 
 class EnhancedPackageInstaller(PackageInstaller):
@@ -240,22 +1162,113 @@ class EnhancedPackageInstaller(PackageInstaller):
     managing batch installations with detailed error handling and verification.
     """
     
-    def __init__(self, logger: Optional[logging.Logger] = None):
-        super().__init__()
+    # Prefer the enhanced Chocolatey manager if available
+    _manager_cls = _EnhancedChocolateyManagerCls or _ChocolateyManagerCls
+    
+    def __init__(self, logger: Optional[logging.Logger] = None, manager: Optional[Any] = None):
+        super().__init__(manager)
         self.logger = logger or logging.getLogger(__name__)
+    
+    def _log(self, level: int, message: str, *args: Any) -> None:
+        """
+        Log message if logger is available and enabled for the level.
         
-        # Try to use enhanced Chocolatey manager if available
-        try:
-            from software.chocolatey_manager import EnhancedChocolateyManager
-            self.chocolatey_manager = EnhancedChocolateyManager()
-        except ImportError:
-            # Keep the basic manager or None
-            pass
+        Arguments are %-formatted by logging only when the record is emitted.
+        """
+        if self.logger and self.logger.isEnabledFor(level):
+            self.logger.log(level, message, *args)
+    
+    def build_install_command(
+        self,
+        package_name: str,
+        force: bool = True,
+        allow_empty_checksums: bool = False,
+        additional_args: Optional[List[str]] = None
+    ) -> Tuple[str, ...]:
+        """
+        Build the choco install argument list for a package.
+        
+        Args:
+            package_name: Name of the package to install
+            force: Whether to force installation
+            allow_empty_checksums: Whether to allow empty checksums
+            additional_args: Additional command line arguments
+        
+        Returns:
+            Tuple[str, ...]: Immutable command tokens, reusable across retries
+        """
+        return (
+            (_choco_executable(), "install", package_name, "-y") +
+            self._install_flag_args(force, allow_empty_checksums, additional_args) +
+            tuple(self._cache_source_args(package_name))
+        )
+    
+    @staticmethod
+    def _install_flag_args(
+        force: bool,
+        allow_empty_checksums: bool,
+        additional_args: Optional[List[str]]
+    ) -> Tuple[str, ...]:
+        """Get the option tokens shared by every install with these settings."""
+        flag_args = []
+        
+        if force:
+            flag_args.append("--force")
+        
+        if allow_empty_checksums:
+            flag_args.append("--allow-empty-checksums")
+        
+        if additional_args:
+            flag_args.extend(additional_args)
+        
+        return tuple(flag_args)
     
-    def _log(self, level: str, message: str) -> None:
-        """Log message if logger is available."""
-        if self.logger and hasattr(self.logger, level):
-            getattr(self.logger, level)(message)
+    def make_installer(
+        self,
+        force: bool = True,
+        allow_empty_checksums: bool = False,
+        additional_args: Optional[List[str]] = None,
+        timeout: int = 300,
+        serialize: bool = False,
+        on_output: Optional[Callable[[str, str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> Callable[[str], PackageInstallResult]:
+        """
+        Create an install function specialized for a fixed set of options.
+        
+        The option tokens are computed once, so a batch sharing the same
+        settings only adds the package name (and cache source) per install.
+        
+        Args:
+            force: Whether to force installation
+            allow_empty_checksums: Whether to allow empty checksums
+            additional_args: Additional command line arguments
+            timeout: Installation timeout in seconds
+            serialize: Whether installs hold the global install lock
+            on_output: Called with (package_name, line) for each output line
+            should_stop: Polled during installs; True cancels the running install
+        
+        Returns:
+            Callable[[str], PackageInstallResult]: Function installing one package by name
+        """
+        flag_args = self._install_flag_args(force, allow_empty_checksums, additional_args)
+        
+        def install(package_name: str) -> PackageInstallResult:
+            name = package_name.strip() if package_name else package_name
+            if not name:
+                return self.install_package(package_name, timeout=timeout, serialize=serialize)
+            
+            cmd_parts = (
+                (_choco_executable(), "install", name, "-y") + flag_args +
+                tuple(self._cache_source_args(name))
+            )
+            return self.install_package(
+                name, timeout=timeout, cmd_parts=cmd_parts, serialize=serialize,
+                on_output=functools.partial(on_output, name) if on_output else None,
+                should_stop=should_stop
+            )
+        
+        return install
     
     def install_package(
         self, 
@@ -263,7 +1276,11 @@ class EnhancedPackageInstaller(PackageInstaller):
         force: bool = True,
         allow_empty_checksums: bool = False,
         timeout: int = 300,
-        additional_args: Optional[List[str]] = None
+        additional_args: Optional[List[str]] = None,
+        cmd_parts: Optional[Sequence[str]] = None,
+        serialize: bool = False,
+        on_output: Optional[Callable[[str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None
     ) -> PackageInstallResult:
         """
         Install a single package with enhanced error reporting.
@@ -274,63 +1291,73 @@ class EnhancedPackageInstaller(PackageInstaller):
             allow_empty_checksums: Whether to allow empty checksums
             timeout: Installation timeout in seconds
             additional_args: Additional command line arguments
+            cmd_parts: Prebuilt command tokens (overrides the options above)
+            serialize: Whether to hold the global install lock while choco runs
+            on_output: Called with each output line as choco produces it
+            should_stop: Polled while choco runs; True cancels the install
         
         Returns:
             PackageInstallResult: Detailed installation result
         """
         if not package_name or not package_name.strip():
-            return PackageInstallResult(
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message="Package name cannot be empty"
             )
         
         package_name = package_name.strip()
         start_time = time.time()
-        self._log("info", f"Starting installation of {package_name}")
+        self._log(logging.INFO, "Starting installation of %s", package_name)
         
         # Check prerequisites
         if not self.is_chocolatey_available():
-            self._log("error", "Chocolatey is not available")
-            return PackageInstallResult(
+            self._log(logging.ERROR, "Chocolatey is not available")
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message="Chocolatey is not installed or not available in PATH"
             )
         
         # Build enhanced command
-        cmd_parts = ["choco", "install", package_name, "-y"]
-        
-        if force:
-            cmd_parts.append("--force")
-        
-        if allow_empty_checksums:
-            cmd_parts.append("--allow-empty-checksums")
-        
-        if additional_args:
-            cmd_parts.extend(additional_args)
-        
-        cmd = " ".join(cmd_parts)
-        self._log("debug", f"Installation command: {cmd}")
+        if cmd_parts is not None:
+            cmd = tuple(cmd_parts)
+        else:
+            cmd = self.build_install_command(
+                package_name, force, allow_empty_checksums, additional_args
+            )
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, "Installation command: %s", shlex.join(cmd))
         
         try:
-            return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=timeout
-            )
+            with _INSTALL_LOCK if serialize else nullcontext():
+                return_code, stdout, stderr = _run_streaming_command(
+                    cmd, timeout, on_line=on_output, should_stop=should_stop
+                )
             
             install_time = time.time() - start_time
-            self._log("debug", f"Installation completed in {install_time:.1f} seconds")
+            
+            if should_stop is not None and should_stop():
+                self._log(logging.INFO, "Installation of %s cancelled by user", package_name)
+                return PackageInstallResult(
+                    package_name=package_name,
+                    status=InstallationStatus.SKIPPED,
+                    message="Cancelled by user",
+                    return_code=return_code,
+                    install_time=install_time,
+                    output=stdout,
+                    error_output=stderr,
+                    command_used=cmd
+                )
+            self._log(logging.DEBUG, "Installation completed in %.1f seconds", install_time)
             
             # Enhanced result analysis
-            success, analysis_msg, warnings = self._analyze_installation_result(
+            success, analysis_msg, warnings, relevant_errors = self._analyze_installation_result(
                 return_code, stdout, stderr, package_name
             )
             
             if success:
-                self._log("info", f"Successfully installed {package_name}")
-                return PackageInstallResult(
+                self._log(logging.INFO, "Successfully installed %s", package_name)
+                return PackageInstallResult.success(
                     package_name=package_name,
-                    status=InstallationStatus.SUCCESS,
                     message=analysis_msg,
                     return_code=return_code,
                     install_time=install_time,
@@ -340,25 +1367,24 @@ class EnhancedPackageInstaller(PackageInstaller):
                     warnings=warnings
                 )
             else:
-                self._log("error", f"Failed to install {package_name}: {analysis_msg}")
-                return PackageInstallResult(
+                self._log(logging.ERROR, "Failed to install %s: %s", package_name, analysis_msg)
+                return PackageInstallResult.failure(
                     package_name=package_name,
-                    status=InstallationStatus.FAILED,
                     message=f"Installation failed: {analysis_msg}",
                     return_code=return_code,
                     install_time=install_time,
                     output=stdout,
                     error_output=stderr,
                     command_used=cmd,
-                    warnings=warnings
+                    warnings=warnings,
+                    relevant_error_lines=relevant_errors
                 )
                 
         except subprocess.TimeoutExpired:
             install_time = time.time() - start_time
-            self._log("error", f"Installation timed out for {package_name} after {timeout} seconds")
-            return PackageInstallResult(
+            self._log(logging.ERROR, "Installation timed out for %s after %d seconds", package_name, timeout)
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message=f"Installation timed out after {timeout} seconds",
                 install_time=install_time,
                 error_output="Installation timeout",
@@ -367,15 +1393,199 @@ class EnhancedPackageInstaller(PackageInstaller):
             )
         except Exception as e:
             install_time = time.time() - start_time
-            self._log("error", f"Installation exception for {package_name}: {str(e)}")
-            return PackageInstallResult(
+            self._log(logging.ERROR, "Installation exception for %s: %s", package_name, e)
+            return PackageInstallResult.failure(
                 package_name=package_name,
-                status=InstallationStatus.FAILED,
                 message=f"Installation error: {str(e)}",
                 install_time=install_time,
                 error_output=str(e),
-                command_used=cmd
+                command_used=cmd,
+                relevant_error_lines=_relevant_error_lines(str(e))
+            )
+    
+    def install_packages(
+        self,
+        packages: List[str],
+        batch_size: int = INSTALL_BATCH_SIZE,
+        force: bool = True,
+        allow_empty_checksums: bool = False,
+        additional_args: Optional[List[str]] = None,
+        timeout: int = 300,
+        serialize: bool = False,
+        on_output: Optional[Callable[[str], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> List[PackageInstallResult]:
+        """
+        Install packages with one choco invocation per batch.
+        
+        Batching amortizes choco's startup cost over several packages. The
+        combined log is split at package headers and each section analyzed
+        like a single install; return codes come from choco's failure summary.
+        
+        Args:
+            packages: Names of the packages to install
+            batch_size: Maximum number of packages per choco invocation
+            force: Whether to force installation
+            allow_empty_checksums: Whether to allow empty checksums
+            additional_args: Additional command line arguments
+            timeout: Installation timeout per package in seconds
+            serialize: Whether to hold the global install lock while choco runs
+            on_output: Called with each output line as choco produces it
+            should_stop: Polled while choco runs; True cancels the current
+                batch and skips the remaining ones
+        
+        Returns:
+            List[PackageInstallResult]: One result per non-empty package name, in input order
+        """
+        results = []
+        names = [package.strip() for package in packages if package and package.strip()]
+        if not names:
+            return results
+        
+        if not self.is_chocolatey_available():
+            self._log(logging.ERROR, "Chocolatey is not available")
+            return [
+                PackageInstallResult.failure(
+                    package_name=name,
+                    message="Chocolatey is not installed or not available in PATH"
+                )
+                for name in names
+            ]
+        
+        flag_args = self._install_flag_args(force, allow_empty_checksums, additional_args)
+        batch_size = max(1, batch_size)
+        
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            if should_stop is not None and should_stop():
+                results.extend(
+                    PackageInstallResult(name, InstallationStatus.SKIPPED, "Cancelled by user")
+                    for name in batch
+                )
+                continue
+            results.extend(self._install_batch(
+                batch, flag_args, timeout, serialize, on_output, should_stop
+            ))
+        
+        return results
+    
+    def _install_batch(
+        self,
+        batch: List[str],
+        flag_args: Tuple[str, ...],
+        timeout: int,
+        serialize: bool,
+        on_output: Optional[Callable[[str], None]],
+        should_stop: Optional[Callable[[], bool]] = None
+    ) -> List[PackageInstallResult]:
+        """Install one batch of packages with a single choco invocation."""
+        # The cache source lists the configured sources too, so one cached package is enough
+        source_args = next(
+            (args for args in map(self._cache_source_args, batch) if args), []
+        )
+        cmd = (_choco_executable(), "install", *batch, "-y") + flag_args + tuple(source_args)
+        batch_timeout = timeout * len(batch)
+        
+        self._log(logging.INFO, "Starting batch installation of %d packages", len(batch))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, "Installation command: %s", shlex.join(cmd))
+        start_time = time.time()
+        
+        try:
+            with _INSTALL_LOCK if serialize else nullcontext():
+                return_code, stdout, stderr = _run_streaming_command(
+                    cmd, batch_timeout, on_line=on_output,
+                    tail_lines=OUTPUT_TAIL_LINES * len(batch),
+                    should_stop=should_stop
+                )
+        except subprocess.TimeoutExpired:
+            self._log(logging.ERROR, "Batch installation timed out after %d seconds", batch_timeout)
+            return [
+                PackageInstallResult.failure(
+                    package_name=name,
+                    message=f"Installation timed out after {batch_timeout} seconds",
+                    install_time=time.time() - start_time,
+                    error_output="Installation timeout",
+                    command_used=cmd,
+                    warnings=["Consider increasing timeout for large packages"]
+                )
+                for name in batch
+            ]
+        except Exception as e:
+            self._log(logging.ERROR, "Batch installation exception: %s", e)
+            return [
+                PackageInstallResult.failure(
+                    package_name=name,
+                    message=f"Installation error: {str(e)}",
+                    install_time=time.time() - start_time,
+                    error_output=str(e),
+                    command_used=cmd
+                )
+                for name in batch
+            ]
+        
+        # Time is shared by the batch, so attribute an equal share to each package
+        install_time = (time.time() - start_time) / len(batch)
+        
+        if should_stop is not None and should_stop():
+            self._log(logging.INFO, "Batch installation cancelled by user")
+            return [
+                PackageInstallResult(
+                    package_name=name,
+                    status=InstallationStatus.SKIPPED,
+                    message="Cancelled by user",
+                    install_time=install_time,
+                    command_used=cmd
+                )
+                for name in batch
+            ]
+        failed_codes = _failed_package_codes(stdout)
+        batch_succeeded = return_code == 0 or return_code in _RESTART_REQUIRED_CODES
+        sections = _split_batch_output(stdout, batch)
+        
+        results = []
+        for name in batch:
+            section = sections[name]
+            # A failed run without a failure summary (e.g. an early abort)
+            # only clears packages choco explicitly reported as installed
+            if name.lower() in failed_codes:
+                package_code = failed_codes[name.lower()]
+            elif batch_succeeded:
+                package_code = return_code
+            elif _reported_successful(section, name):
+                package_code = 0
+            else:
+                package_code = return_code
+            success, analysis_msg, warnings, relevant_errors = self._analyze_installation_result(
+                package_code, section, (stderr or section) if package_code else "", name
             )
+            
+            if success:
+                self._log(logging.INFO, "Successfully installed %s", name)
+                results.append(PackageInstallResult.success(
+                    package_name=name,
+                    message=analysis_msg,
+                    return_code=package_code,
+                    install_time=install_time,
+                    output=section,
+                    command_used=cmd,
+                    warnings=warnings
+                ))
+            else:
+                self._log(logging.ERROR, "Failed to install %s: %s", name, analysis_msg)
+                results.append(PackageInstallResult.failure(
+                    package_name=name,
+                    message=f"Installation failed: {analysis_msg}",
+                    return_code=package_code,
+                    install_time=install_time,
+                    output=section,
+                    error_output=stderr,
+                    command_used=cmd,
+                    warnings=warnings,
+                    relevant_error_lines=relevant_errors
+                ))
+        
+        return results
     
     def _analyze_installation_result(
         self, 
@@ -383,7 +1593,7 @@ class EnhancedPackageInstaller(PackageInstaller):
         stdout: str, 
         stderr: str, 
         package_name: str
-    ) -> Tuple[bool, str, List[str]]:
+    ) -> Tuple[bool, str, List[str], Tuple[str, ...]]:
         """
         Enhanced analysis of installation output to determine success/failure.
         
@@ -394,75 +1604,67 @@ class EnhancedPackageInstaller(PackageInstaller):
             package_name: Package name being installed
         
         Returns:
-            Tuple[bool, str, List[str]]: (is_successful, message, warnings)
+            Tuple[bool, str, List[str], Tuple[str, ...]]:
+                (is_successful, message, warnings, relevant_error_lines)
         """
         warnings = []
-        stdout_lower = stdout.lower()
-        stderr_lower = stderr.lower()
         
         # Check return code first
+        if return_code in _RESTART_REQUIRED_CODES:
+            warnings.append("Restart required to complete installation")
+            return True, f"Successfully installed {package_name} (restart required)", warnings, ()
+        
         if return_code != 0:
             error_analysis = self._analyze_error_code(return_code, stderr)
-            return False, error_analysis, warnings
-        
-        # Enhanced success indicators
-        success_indicators = [
-            'successfully installed',
-            'installation was successful',
-            f'the install of {package_name.lower()}',
-            'chocolatey installed',
-            f'{package_name.lower()} has been installed',
-            'package files install completed'
-        ]
-        
-        # Enhanced failure indicators
-        failure_indicators = [
-            'failed',
-            'error occurred',
-            'access denied',
-            'not found',
-            'unable to',
-            'installation failed',
-            'package was not found',
-            'chocolatey failed',
-            'execution failed'
-        ]
+            return False, error_analysis, warnings, _relevant_error_lines(stderr)
         
-        # Warning indicators
-        warning_indicators = [
-            'warning',
-            'deprecated',
-            'outdated',
-            'checksum validation',
-            'unable to verify'
-        ]
+        # Only the tails are scanned: choco reports the outcome (including the
+        # "The install of <name>" line) at the end of its log, and everything
+        # before it is download/extraction noise. If the tails hold no verdict
+        # at all, the full output is scanned instead.
+        package_lower = package_name.lower()
+        package_phrases = (f'the install of {package_lower}', f'{package_lower} has been installed')
         
-        # Check for success
-        has_success = any(indicator in stdout_lower for indicator in success_indicators)
-        has_failure = any(indicator in stdout_lower or indicator in stderr_lower 
-                         for indicator in failure_indicators)
+        for stdout_scan, stderr_scan in (
+            (stdout[-ANALYSIS_STDOUT_WINDOW:], stderr[-ANALYSIS_STDERR_WINDOW:]),
+            (stdout, stderr)
+        ):
+            # One scan over both streams; success counts static indicators
+            # plus package-specific phrases, and only from stdout
+            found = _scan_indicators(
+                f"{stdout_scan}\n{stderr_scan}", package_phrases, success_end=len(stdout_scan)
+            )
+            
+            has_success = bool(found['success'])
+            has_failure = bool(found['failure'])
+            
+            if (has_success or has_failure or
+                    (len(stdout) <= ANALYSIS_STDOUT_WINDOW and len(stderr) <= ANALYSIS_STDERR_WINDOW)):
+                break
         
         # Check for warnings
-        for indicator in warning_indicators:
-            if indicator in stdout_lower or indicator in stderr_lower:
+        for indicator in WARNING_INDICATORS:
+            if indicator in found['warning']:
                 warnings.append(f"Installation warning: {indicator} detected")
         
         # Determine result
         if has_success and not has_failure:
-            return True, f"Successfully installed {package_name}", warnings
+            return True, f"Successfully installed {package_name}", warnings, ()
         elif has_failure:
             # Extract specific error from stderr
-            if stderr.strip():
-                error_lines = [line.strip() for line in stderr.split('\n') if line.strip()]
-                if error_lines:
-                    return False, error_lines[-1], warnings
-            return False, "Installation failed (see output for details)", warnings
+            relevant_error = _last_line(stderr)
+            if relevant_error:
+                return False, relevant_error, warnings, _relevant_error_lines(stderr)
+            failure_lines = _extract_failure_lines(stdout, stderr)
+            if failure_lines:
+                return False, "; ".join(failure_lines), warnings, _relevant_error_lines(stderr)
+            return False, "Installation failed (see output for details)", warnings, _relevant_error_lines(stderr)
         else:
             # Ambiguous result - check return code
             if return_code == 0:
-                return True, f"Package {package_name} processed (check output for details)", warnings
+                return True, f"Package {package_name} processed (check output for details)", warnings, ()
             else:
-                return False, f"Installation failed with return code {return_code}", warnings
+                return False, f"Installation failed with return code {return_code}", warnings, _relevant_error_lines(stderr)
     
     def _analyze_error_code(self, return_code: int, stderr: str) -> str:
         """
@@ -475,28 +1677,60 @@ class EnhancedPackageInstaller(PackageInstaller):
         Returns:
             str: Human-readable error message
         """
-        error_codes = {
-            1: "General error or unspecified failure",
-            2: "File not found or package not found",
-            3: "Invalid arguments or configuration error",
-            4: "Access denied or permission error",
-            5: "Network error or download failure",
-            48: "Package installation cancelled by user",
-            1641: "Installation successful but restart required",
-            3010: "Installation successful but restart required"
-        }
+        base_message = _CHOCO_ERROR_CODES.get(return_code, f"Unknown error (code {return_code})")
         
-        base_message = error_codes.get(return_code, f"Unknown error (code {return_code})")
-        
-        if stderr.strip():
-            error_lines = [line.strip() for line in stderr.split('\n') if line.strip()]
-            if error_lines:
-                relevant_error = error_lines[-1]
-                return f"{base_message}: {relevant_error}"
+        relevant_error = _last_line(stderr)
+        if relevant_error:
+            return f"{base_message}: {relevant_error}"
         
         return base_message
 
 
+# Progress messages are batched and flushed when either limit is reached
+PROGRESS_FLUSH_LINES = 16
+PROGRESS_FLUSH_INTERVAL = 0.1  # seconds
+
+
+# Shared installer instance reused by all install workers
+_installer_instance: Optional[EnhancedPackageInstaller] = None
+_installer_lock = threading.Lock()
+
+
+def get_installer() -> EnhancedPackageInstaller:
+    """
+    Get the shared EnhancedPackageInstaller, creating it on first use.
+    
+    The instance is shared across worker threads, so it must stay free of
+    per-install state: install_package and the result analyzers only use
+    their arguments and locals, Chocolatey availability is cached by the
+    manager with a short TTL, and the package cache index opens a new
+    database connection per call.
+    
+    Returns:
+        EnhancedPackageInstaller: Shared installer instance
+    """
+    global _installer_instance
+    
+    if _installer_instance is None:
+        with _installer_lock:
+            if _installer_instance is None:
+                _installer_instance = EnhancedPackageInstaller()
+    
+    return _installer_instance
+
+
+def invalidate_installer_cache() -> None:
+    """
+    Forget cached Chocolatey state in the shared installer, if one exists.
+    
+    Called after Chocolatey itself is installed, so install workers stop
+    failing their pre-checks on a stale "not available" result.
+    """
+    invalidate_prereq_cache()
+    if _installer_instance is not None:
+        _installer_instance.invalidate_chocolatey_cache()
+
+
 class PackageInstallWorker(BaseWorker):
     """
     Enhanced worker class for installing packages in the background.
@@ -507,22 +1741,106 @@ class PackageInstallWorker(BaseWorker):
     
     def __init__(self, packages: List[str], install_options: Optional[Dict[str, Any]] = None):
         super().__init__()
-        self.packages = packages
+        # Drop repeated names (case-insensitively), keeping the first spelling
+        unique = {}
+        for package in packages:
+            unique.setdefault(package.strip().lower(), package.strip())
+        self.packages = list(unique.values())
         self.install_options = install_options or {}
-        self.installer = EnhancedPackageInstaller()
+        self.installer = get_installer()
         self.results: List[PackageInstallResult] = []
         
+        # Running summary accumulators, updated as each result arrives
+        self._successful: List[PackageInstallResult] = []
+        self._failed: List[PackageInstallResult] = []
+        self._skipped: List[PackageInstallResult] = []
+        self._total_time = 0.0
+        self._results_lock = threading.Lock()
+        self._progress_table: List[Tuple[str, int]] = []
+        
         # Installation options
         self.force_install = self.install_options.get('force', True)
         self.allow_empty_checksums = self.install_options.get('allow_empty_checksums', False)
         self.package_timeout = self.install_options.get('package_timeout', 300)
         self.continue_on_failure = self.install_options.get('continue_on_failure', True)
         self.max_retries = self.install_options.get('max_retries', 1)
+        # Prefetching needs "choco download", a licensed-edition command, so it is opt-in
+        self.use_package_cache = self.install_options.get('use_package_cache', False)
+        # Probing costs a choco run per package before any install starts, so it is opt-in
+        self.probe_availability = self.install_options.get('probe_availability', False)
+        # Concurrent choco runs ('parallelism' is accepted as an alias)
+        self.max_parallel = max(1, self.install_options.get(
+            'max_parallel',
+            self.install_options.get(
+                'parallelism', min(MAX_CONCURRENT_INSTALLATIONS, os.cpu_count() or 2)
+            )
+        ))
+        # Overlapping MSI transactions fail with 1618, so choco runs take turns by default
+        self.serialize_msi = self.install_options.get('serialize_msi', True)
+        self.stream_output = self.install_options.get('stream_output', True)
+        self.batch_size = self.install_options.get('batch_size', INSTALL_BATCH_SIZE)
+        # Batches replace the pool by default only when installs are sequential
+        self.batch_install = self.install_options.get(
+            'batch_install', self.max_parallel == 1 or self.serialize_msi
+        )
+        self.additional_args = list(self.install_options.get('additional_args', []))
+        
+        # Install function specialized for this batch's options
+        self._install = self.installer.make_installer(
+            force=self.force_install,
+            allow_empty_checksums=self.allow_empty_checksums,
+            additional_args=self.additional_args,
+            timeout=self.package_timeout,
+            serialize=self.serialize_msi,
+            on_output=self._emit_install_output if self.stream_output else None,
+            should_stop=self.should_stop
+        )
+        
+        # Packages found to be missing from the repository during pre-checks
+        self.unavailable_packages: Set[str] = set()
+        
+        # Lowercased names of packages already installed locally
+        self.skip_installed = self.install_options.get('skip_installed', True)
+        self.installed_packages: Set[str] = set()
         
         # Signals for progress reporting
         self.signals = getattr(self, 'signals', None)
+        
+        # Buffered progress lines, emitted together to limit UI signal traffic
+        self._progress_buf: List[str] = []
+        self._last_flush = time.monotonic()
+        self._progress_lock = threading.Lock()
     
     def emit_progress(self, message: str, progress: Optional[int] = None) -> None:
+        """Queue a progress message, emitting buffered messages in batches."""
+        with self._progress_lock:
+            self._progress_buf.append(message)
+            flush = (
+                progress is not None or
+                len(self._progress_buf) >= PROGRESS_FLUSH_LINES or
+                time.monotonic() - self._last_flush >= PROGRESS_FLUSH_INTERVAL
+            )
+        
+        if flush:
+            self._flush_progress(progress)
+    
+    def _emit_install_output(self, package: str, line: str) -> None:
+        """Forward a live choco output line to the progress stream."""
+        if line.strip():
+            self.emit_progress(f"    [{package}] {line.strip()}")
+    
+    def _flush_progress(self, progress: Optional[int] = None) -> None:
+        """Emit all buffered progress messages as a single update."""
+        with self._progress_lock:
+            if not self._progress_buf:
+                return
+            
+            message = "\n".join(self._progress_buf)
+            self._progress_buf.clear()
+            self._last_flush = time.monotonic()
+            self._emit_progress_now(message, progress)
+    
+    def _emit_progress_now(self, message: str, progress: Optional[int] = None) -> None:
         """Emit progress signal if available."""
         if self.signals and hasattr(self.signals, 'emit_progress'):
             if progress is not None:
@@ -538,47 +1856,210 @@ class PackageInstallWorker(BaseWorker):
         try:
             self.emit_progress("Starting package installation...")
             
-            # Pre-installation checks
-            if not self._run_pre_installation_checks():
-                self.emit_progress("Pre-installation checks failed. Aborting.")
+            # Pre-installation checks, overlapped with the local cache prefetch
+            executor = ThreadPoolExecutor(max_workers=2)
+            try:
+                prefetch = None
+                if self.use_package_cache:
+                    prefetch = executor.submit(self.installer._ensure_local_cache, self.packages)
+                
+                if not self._run_pre_installation_checks():
+                    self.emit_progress("Pre-installation checks failed. Aborting.")
+                    return
+                
+                if prefetch is not None:
+                    self._flush_progress()
+                    try:
+                        cached = prefetch.result()
+                    except Exception as e:
+                        cached = []
+                        self.emit_progress(f"⚠ Warning: Package cache prefetch failed: {str(e)}")
+                    if cached:
+                        self.emit_progress(f"✓ {len(cached)}/{len(self.packages)} packages available from local cache")
+            finally:
+                executor.shutdown(wait=False)
+            
+            self._install_all()
+            
+            # Generate summary
+            self._generate_installation_summary()
+            
+        except Exception as e:
+            self.emit_progress(f"Critical error during installation: {str(e)}")
+        finally:
+            self._flush_progress()
+    
+    async def run_async(self) -> None:
+        """
+        Install packages from an asyncio event loop without blocking it.
+        
+        The batch runs on a worker thread through the regular run(), so
+        pooling, streaming output and cancellation behave the same.
+        """
+        await asyncio.to_thread(self.run)
+    
+    def _install_all(self) -> None:
+        """
+        Install all packages.
+        
+        Packages are installed through a pool of up to max_parallel workers,
+        or in multi-package choco batches (batch_install, the default when
+        installs are sequential: max_parallel=1 or serialize_msi); both
+        amortize choco's per-run startup cost.
+        """
+        total_packages = len(self.packages)
+        completed = 0
+        
+        # Progress messages and percentages, indexed by completed count - 1
+        self._progress_table = [
+            (f"Progress: {percent}%", percent)
+            for percent in (int((i + 1) / total_packages * 100) for i in range(total_packages))
+        ]
+        
+        pending = []
+        for i, package in enumerate(self.packages):
+            if package in self.unavailable_packages:
+                completed += 1
+                self._complete_package(PackageInstallResult(
+                    package_name=package,
+                    status=InstallationStatus.SKIPPED,
+                    message="Package not found in Chocolatey repository"
+                ), completed, total_packages)
+            elif package.lower() in self.installed_packages:
+                completed += 1
+                self._complete_package(PackageInstallResult(
+                    package_name=package,
+                    status=InstallationStatus.SKIPPED,
+                    message="Already installed"
+                ), completed, total_packages)
+            else:
+                pending.append((i, package))
+        
+        if self.batch_install and len(pending) > 1:
+            self._install_batched(pending, completed, total_packages)
+        else:
+            self._install_pooled(pending, completed, total_packages)
+    
+    def _install_batched(self, pending: List[Tuple[int, str]], completed: int, total_packages: int) -> None:
+        """Install pending packages in batches of batch_size per choco invocation."""
+        batch_size = max(1, self.batch_size)
+        
+        for start in range(0, len(pending), batch_size):
+            if self.should_stop():
+                self.emit_progress("Installation stopped by user.")
                 return
             
-            total_packages = len(self.packages)
-            successful_installs = 0
-            failed_installs = 0
+            batch = [package for _, package in pending[start:start + batch_size]]
+            first_index = pending[start][0]
+            self.emit_progress(
+                f"Installing packages {first_index+1}-{first_index+len(batch)}/{total_packages}: "
+                f"{', '.join(batch)}"
+            )
+            self._flush_progress()
             
-            for i, package in enumerate(self.packages):
-                if self.should_stop():
-                    self.emit_progress("Installation stopped by user.")
-                    break
+            results = self.installer.install_packages(
+                batch,
+                batch_size=batch_size,
+                force=self.force_install,
+                allow_empty_checksums=self.allow_empty_checksums,
+                additional_args=self.additional_args,
+                timeout=self.package_timeout,
+                serialize=self.serialize_msi,
+                on_output=functools.partial(self._emit_install_output, "batch") if self.stream_output else None,
+                should_stop=self.should_stop
+            )
+            
+            for result in results:
+                # Failed packages fall back to individual installs with retries
+                if (result.status is InstallationStatus.FAILED and self.max_retries > 0
+                        and not self._should_not_retry(result) and not self.should_stop()):
+                    self.emit_progress(f"  Retrying {result.package_name} individually")
+                    result = self._install_with_retries(result.package_name)
                 
-                self.emit_progress(f"Installing package {i+1}/{total_packages}: {package}")
+                completed += 1
+                self._complete_package(result, completed, total_packages)
                 
-                # Install package with retries
-                result = self._install_with_retries(package)
-                self.results.append(result)
+                if result.status is InstallationStatus.FAILED and not self.continue_on_failure:
+                    self.emit_progress(f"Installation failed for {result.package_name}. Stopping due to continue_on_failure=False")
+                    return
+    
+    def _install_pooled(self, pending: List[Tuple[int, str]], completed: int, total_packages: int) -> None:
+        """
+        Install pending packages through a pool of up to max_parallel workers.
+        
+        Serialized installs would only queue on the install lock, reporting
+        every package as installing at once, so they use a single worker.
+        """
+        workers = 1 if self.serialize_msi else min(self.max_parallel, len(pending))
+        executor = ThreadPoolExecutor(max_workers=max(1, workers))
+        futures = {}
+        try:
+            for i, package in pending:
+                futures[executor.submit(self._install_task, i, package)] = package
+            
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = PackageInstallResult.failure(
+                        package_name=futures[future],
+                        message=f"Installation error: {str(e)}"
+                    )
                 
-                # Report result
-                self._report_package_result(result)
+                if result is not None:
+                    completed += 1
+                    self._complete_package(result, completed, total_packages)
                 
-                # Update counters
-                if result.status == InstallationStatus.SUCCESS:
-                    successful_installs += 1
-                else:
-                    failed_installs += 1
-                    if not self.continue_on_failure:
-                        self.emit_progress(f"Installation failed for {package}. Stopping due to continue_on_failure=False")
-                        break
+                if self.should_stop():
+                    self.emit_progress("Installation stopped by user.")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
                 
-                # Update progress
-                progress = int(((i + 1) / total_packages) * 100)
-                self.emit_progress(f"Progress: {progress}%", progress)
+                if (result is not None and result.status is InstallationStatus.FAILED
+                        and not self.continue_on_failure):
+                    self.emit_progress(f"Installation failed for {result.package_name}. Stopping due to continue_on_failure=False")
+                    executor.shutdown(wait=False, cancel_futures=True)
+                    break
+        finally:
+            executor.shutdown(wait=False)
+    
+    def _install_task(self, index: int, package: str) -> Optional[PackageInstallResult]:
+        """Install one package on a pool thread; returns None if stopped before starting."""
+        if self.should_stop():
+            return None
+        
+        self.emit_progress(f"Installing package {index+1}/{len(self.packages)}: {package}")
+        return self._install_with_retries(package)
+    
+    def _complete_package(self, result: PackageInstallResult, completed: int, total_packages: int) -> None:
+        """Record and report a finished package, then update overall progress."""
+        self._record_result(result)
+        
+        # Report result
+        self._report_package_result(result)
+        self.emit_progress(
+            f"[{completed}/{total_packages}] "
+            f"ok={len(self._successful)} fail={len(self._failed)}"
+        )
+        
+        # Update progress
+        self.emit_progress(*self._progress_table[completed - 1])
+    
+    def _record_result(self, result: PackageInstallResult) -> None:
+        """Store a result and update the running summary accumulators."""
+        # Enum members are singletons; `is` avoids the Enum.__eq__ dispatch
+        with self._results_lock:
+            self.results.append(result)
             
-            # Generate summary
-            self._generate_installation_summary()
+            if result.status is InstallationStatus.SUCCESS:
+                self._successful.append(result)
+            elif result.status is InstallationStatus.FAILED:
+                self._failed.append(result)
+            elif result.status is InstallationStatus.SKIPPED:
+                self._skipped.append(result)
             
-        except Exception as e:
-            self.emit_progress(f"Critical error during installation: {str(e)}")
+            if result.install_time:
+                self._total_time += result.install_time
     
     def _install_with_retries(self, package: str) -> PackageInstallResult:
         """Install package with retry logic."""
@@ -588,39 +2069,61 @@ class PackageInstallWorker(BaseWorker):
             if attempt > 0:
                 self.emit_progress(f"  Retry {attempt}/{self.max_retries} for {package}")
             
-            result = self.installer.install_package(
-                package,
-                force=self.force_install,
-                allow_empty_checksums=self.allow_empty_checksums,
-                timeout=self.package_timeout
-            )
+            # Show pending messages before the (long) install blocks
+            self._flush_progress()
             
-            if result.status == InstallationStatus.SUCCESS:
+            result = self._install(package)
+            
+            if result.status is InstallationStatus.SUCCESS or self.should_stop():
                 return result
             
             last_result = result
             
+            if self._should_not_retry(result):
+                if attempt < self.max_retries:
+                    self.emit_progress(f"  Not retrying {package}: failure cannot be fixed by retrying")
+                break
+            
             if attempt < self.max_retries:
-                time.sleep(2)  # Brief delay between retries
+                delay = self._retry_delay(result, attempt)
+                self.emit_progress(f"  Waiting {delay}s before retrying {package}")
+                self._flush_progress()
+                time.sleep(delay)
         
-        return last_result or PackageInstallResult(
+        return last_result or PackageInstallResult.failure(
             package_name=package,
-            status=InstallationStatus.FAILED,
             message="All retry attempts failed"
         )
     
+    @staticmethod
+    def _retry_delay(result: PackageInstallResult, attempt: int) -> int:
+        """Get the delay before retrying a failed attempt (attempt counts from 0)."""
+        return_code = -1 if result.return_code is None else result.return_code
+        if return_code in _TRANSIENT_CODES:
+            return min(RETRY_DELAY ** (attempt + 1), RETRY_BACKOFF_MAX)
+        return RETRY_DELAY
+    
+    @staticmethod
+    def _should_not_retry(result: PackageInstallResult) -> bool:
+        """Check whether a failed install is terminal and should not be retried."""
+        if result.return_code is not None:
+            return result.return_code in _FATAL_CODES
+        
+        details = f"{result.message} {result.error_output}".lower()
+        return any(fragment in details for fragment in _NO_RETRY_MESSAGES)
+    
     def _run_pre_installation_checks(self) -> bool:
         """Run pre-installation checks."""
         self.emit_progress("Running pre-installation checks...")
         
         # Check admin privileges
-        if not check_admin_privileges():
+        if not ADMIN_AVAILABLE:
             self.emit_progress("⚠ Warning: Not running with administrator privileges")
             self.emit_progress("  Some packages may fail to install properly")
         else:
             self.emit_progress("✓ Running with administrator privileges")
         
-        # Check Chocolatey availability
+        # Check Chocolatey availability (primes the installer's cache before pool threads start)
         if not self.installer.is_chocolatey_available():
             self.emit_progress("✗ Chocolatey is not installed or not available")
             return False
@@ -629,8 +2132,7 @@ class PackageInstallWorker(BaseWorker):
         
         # Check disk space (rough estimate)
         try:
-            import shutil
-            total, used, free = shutil.disk_usage('.')
+            total, used, free = _cached_disk_usage('.')
             free_gb = free / (1024**3)
             required_gb = len(self.packages) * 0.075
             
@@ -641,12 +2143,27 @@ class PackageInstallWorker(BaseWorker):
         except Exception as e:
             self.emit_progress(f"⚠ Warning: Could not check disk space: {str(e)}")
         
+        # Probe package availability so unknown names skip the install attempt
+        if self.probe_availability:
+            self._flush_progress()
+            availability = self.installer.probe_packages(self.packages)
+            self.unavailable_packages = {
+                package for package, available in availability.items() if not available
+            }
+            if self.unavailable_packages:
+                self.emit_progress(
+                    f"⚠ Packages not found in repository (will be skipped): "
+                    f"{', '.join(sorted(self.unavailable_packages))}"
+                )
+            else:
+                self.emit_progress(f"✓ All {len(self.packages)} packages found in repository")
+        
         # Test a simple choco command
         self.emit_progress("Testing basic Chocolatey command...")
+        self._flush_progress()
         try:
-            return_code, stdout, stderr = run_command_with_timeout("choco --version", timeout=10)
+            return_code, version, stderr = _cached_choco_version()
             if return_code == 0:
-                version = stdout.strip()
                 self.emit_progress(f"✓ Chocolatey version: {version}")
             else:
                 self.emit_progress(f"⚠ Chocolatey version command failed: {stderr}")
@@ -655,31 +2172,34 @@ class PackageInstallWorker(BaseWorker):
             self.emit_progress(f"⚠ Chocolatey version command error: {str(e)}")
             return False
         
+        # Already-installed packages are skipped unless reinstalling is forced
+        if self.skip_installed and not self.force_install:
+            self.installed_packages = self.installer.get_installed_packages(version)
+            already = [p for p in self.packages if p.lower() in self.installed_packages]
+            if already:
+                self.emit_progress(f"✓ Already installed (will be skipped): {', '.join(already)}")
+        
         self.emit_progress("")
         return True
     
     def _report_package_result(self, result: PackageInstallResult) -> None:
         """Report detailed package installation result."""
-        if result.status == InstallationStatus.SUCCESS:
+        if result.status is InstallationStatus.SUCCESS:
             self.emit_progress(f"✓ {result.package_name} installed successfully")
             if result.install_time:
                 self.emit_progress(f"  Installation time: {result.install_time:.1f} seconds")
             if result.warnings:
                 for warning in result.warnings:
                     self.emit_progress(f"  ⚠ Warning: {warning}")
+        elif result.status is InstallationStatus.SKIPPED:
+            self.emit_progress(f"- {result.package_name} skipped: {result.message}")
         else:
             self.emit_progress(f"✗ {result.package_name} installation failed")
             self.emit_progress(f"  Error: {result.message}")
             
-            # Show relevant error details from stderr
-            if result.error_output:
-                error_lines = result.error_output.strip().split('\n')
-                relevant_errors = [line for line in error_lines if line.strip() and 
-                                 any(keyword in line.lower() for keyword in ['error', 'failed', 'exception'])]
-                
-                for line in relevant_errors[-2:]:  # Show last 2 relevant error lines
-                    if line.strip():
-                        self.emit_progress(f"  {line.strip()}")
+            # Show last 2 relevant error lines from stderr
+            for line in result.relevant_error_lines[-2:]:
+                self.emit_progress(f"  {line}")
             
             # Show return code if available
             if result.return_code is not None:
@@ -687,35 +2207,34 @@ class PackageInstallWorker(BaseWorker):
     
     def _generate_installation_summary(self) -> None:
         """Generate enhanced installation summary."""
-        successful = sum(1 for r in self.results if r.status == InstallationStatus.SUCCESS)
-        failed = sum(1 for r in self.results if r.status == InstallationStatus.FAILED)
-        total = len(self.results)
-        
         self.emit_progress("")
         self.emit_progress("=" * 50)
         self.emit_progress("INSTALLATION SUMMARY")
         self.emit_progress("=" * 50)
-        self.emit_progress(f"Total packages: {total}")
-        self.emit_progress(f"Successful: {successful}")
-        self.emit_progress(f"Failed: {failed}")
+        self.emit_progress(f"Total packages: {len(self.results)}")
+        self.emit_progress(f"Successful: {len(self._successful)}")
+        self.emit_progress(f"Failed: {len(self._failed)}")
+        if self._skipped:
+            self.emit_progress(f"Skipped: {len(self._skipped)}")
         
-        if successful > 0:
+        if self._successful:
             self.emit_progress("\nSuccessfully installed:")
-            for result in self.results:
-                if result.status == InstallationStatus.SUCCESS:
-                    time_str = f" ({result.install_time:.1f}s)" if result.install_time else ""
-                    self.emit_progress(f"  ✓ {result.package_name}{time_str}")
+            for result in self._successful:
+                time_str = f" ({result.install_time:.1f}s)" if result.install_time else ""
+                self.emit_progress(f"  ✓ {result.package_name}{time_str}")
         
-        if failed > 0:
+        if self._failed:
             self.emit_progress("\nFailed installations:")
-            for result in self.results:
-                if result.status == InstallationStatus.FAILED:
-                    self.emit_progress(f"  ✗ {result.package_name}: {result.message}")
+            for result in self._failed:
+                self.emit_progress(f"  ✗ {result.package_name}: {result.message}")
+        
+        if self._skipped:
+            self.emit_progress("\nSkipped:")
+            for result in self._skipped:
+                self.emit_progress(f"  - {result.package_name}: {result.message}")
         
-        # Calculate total installation time
-        total_time = sum(r.install_time for r in self.results if r.install_time)
-        if total_time > 0:
-            self.emit_progress(f"\nTotal installation time: {total_time:.1f} seconds")
+        if self._total_time > 0:
+            self.emit_progress(f"\nTotal installation time: {self._total_time:.1f} seconds")
         
         self.emit_progress("=" * 50)
     
@@ -723,21 +2242,44 @@ class PackageInstallWorker(BaseWorker):
         """Get installation results."""
         return self.results
     
-    def get_summary(self) -> Dict[str, Any]:
-        """Get installation summary as dictionary."""
-        successful = sum(1 for r in self.results if r.status == InstallationStatus.SUCCESS)
-        failed = sum(1 for r in self.results if r.status == InstallationStatus.FAILED)
-        total_time = sum(r.install_time for r in self.results if r.install_time)
+    def get_summary_stats(self) -> Dict[str, Any]:
+        """
+        Get aggregate installation counts and timings.
         
-        return {
-            'total_packages': len(self.results),
-            'successful': successful,
-            'failed': failed,
-            'success_rate': (successful / len(self.results)) * 100 if self.results else 0,
-            'total_time_seconds': total_time,
-            'average_time_per_package': total_time / len(self.results) if self.results else 0,
-            'results': [r.to_dict() for r in self.results]
-        }
+        Reads the running accumulators under a lock, so it is safe to call
+        from the UI thread while installation is in progress.
+        """
+        with self._results_lock:
+            total = len(self.results)
+            successful = len(self._successful)
+            total_time = self._total_time
+            
+            return {
+                'total_packages': total,
+                'successful': successful,
+                'failed': len(self._failed),
+                'skipped': len(self._skipped),
+                'success_rate': (successful / total) * 100 if total else 0,
+                'total_time_seconds': total_time,
+                'average_time_per_package': total_time / total if total else 0
+            }
+    
+    def get_summary(self, include_results: bool = True) -> Dict[str, Any]:
+        """
+        Get installation summary as dictionary.
+        
+        Args:
+            include_results: Whether to add the serialized per-package results
+                (get_summary_stats gives the counts alone)
+        
+        Returns:
+            Dict[str, Any]: Summary statistics, plus 'results' if requested
+        """
+        summary = self.get_summary_stats()
+        if include_results:
+            with self._results_lock:
+                summary['results'] = [r.to_dict() for r in self.results]
+        return summary
 
 
 # Utility functions for testing
@@ -6,12 +6,134 @@ and providing search filtering and sorting capabilities.
 """
 
 import re
-from typing import List, Dict, Optional, Tuple
-from dataclasses import dataclass
+import sys
+import asyncio
+import subprocess
+import threading
+import time
+import shutil
+import locale
+import string
+import functools
+import urllib.parse
+import urllib.request
+import xml.etree.ElementTree as ET
+from collections import OrderedDict, deque
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple, Any, Callable
+from dataclasses import dataclass, field
 from enum import Enum
 
-from core import BaseWorker, run_command_with_timeout, PACKAGE_SEARCH_LIMIT
-from .chocolatey_manager import ChocolateyManager
+# Optional C-backed multi-pattern matcher for description keyword filters
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from core import BaseWorker, run_command_with_timeout, PACKAGE_SEARCH_LIMIT, CHOCOLATEY_SOURCE
+from .chocolatey_manager import ChocolateyManager, get_default_manager
+
+
+# Package names are alphanumeric with dots, hyphens and underscores
+MAX_PACKAGE_NAME_LENGTH = 100
+_PACKAGE_NAME_CHARS = string.ascii_letters + string.digits + '._-'
+_PACKAGE_NAME_RE = re.compile(rf'\A[A-Za-z0-9._-]{{1,{MAX_PACKAGE_NAME_LENGTH}}}\Z')
+
+# Descriptions longer than this are shortened for the package summary
+SUMMARY_MAX_LENGTH = 100
+
+# Successful searches are reused for a few minutes across searchers
+SEARCH_CACHE_TTL = 300  # seconds
+SEARCH_CACHE_SIZE = 128  # entries; the least recently used is evicted beyond this
+_search_cache: 'OrderedDict[Tuple[Any, ...], Tuple[float, Tuple[bool, List[PackageInfo], str]]]' = OrderedDict()
+_search_cache_lock = threading.Lock()
+
+# Successful "choco info" lookups are reused the same way, keyed by lowercased name
+DETAILS_CACHE_TTL = 300  # seconds
+DETAILS_CACHE_SIZE = 256  # entries; the least recently used is evicted beyond this
+_details_cache: 'OrderedDict[str, Tuple[float, str]]' = OrderedDict()
+_details_cache_lock = threading.Lock()
+
+# Failed searches report this many trailing lines of choco's stderr
+SEARCH_STDERR_LINES = 3
+
+# Batch detail lookups run this many "choco info" processes at once
+DETAILS_CONCURRENCY = 8
+DETAILS_TIMEOUT = 30  # seconds per lookup
+
+# Bulk lookups query the source's NuGet v2 OData feed directly
+BULK_QUERY_CHUNK = 50  # ids per feed request, keeping URLs short
+_ODATA_NS = {
+    'atom': 'http://www.w3.org/2005/Atom',
+    'd': 'http://schemas.microsoft.com/ado/2007/08/dataservices',
+    'm': 'http://schemas.microsoft.com/ado/2007/08/dataservices/metadata',
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _choco_executable() -> str:
+    """Resolve the choco executable path once, so searches skip the PATH search."""
+    return shutil.which("choco") or "choco"
+
+
+def _cached_package_info(package_name: str) -> Optional[str]:
+    """Get cached "choco info" output younger than DETAILS_CACHE_TTL, if any."""
+    cache_key = package_name.lower()
+    with _details_cache_lock:
+        cached = _details_cache.get(cache_key)
+        if cached is not None:
+            if time.monotonic() - cached[0] < DETAILS_CACHE_TTL:
+                _details_cache.move_to_end(cache_key)
+                return cached[1]
+            del _details_cache[cache_key]
+    return None
+
+
+def _cache_package_info(package_name: str, output: str) -> None:
+    """Cache successful "choco info" output, evicting the least recently used entry."""
+    with _details_cache_lock:
+        _details_cache[package_name.lower()] = (time.monotonic(), output)
+        if len(_details_cache) > DETAILS_CACHE_SIZE:
+            _details_cache.popitem(last=False)
+
+
+def _raw_package_info(package_name: str) -> str:
+    """
+    Get the raw "choco info" output for a package.
+    
+    Successful lookups are cached for DETAILS_CACHE_TTL seconds; failures
+    raise instead of returning, so they are never cached.
+    """
+    cached = _cached_package_info(package_name)
+    if cached is not None:
+        return cached
+    
+    return_code, stdout, stderr = run_command_with_timeout(
+        [_choco_executable(), "info", package_name, "--limit-output"], timeout=DETAILS_TIMEOUT
+    )
+    if return_code != 0:
+        raise RuntimeError(stderr.strip() or f"choco info exited with code {return_code}")
+    
+    _cache_package_info(package_name, stdout)
+    return stdout
+
+
+# Below this many keywords, plain substring checks beat building an automaton
+KEYWORD_AUTOMATON_MIN = 3
+
+
+@functools.lru_cache(maxsize=32)
+def _keyword_automaton(keywords: Tuple[str, ...]) -> Optional[Any]:
+    """Build (once per keyword set) an Aho-Corasick automaton over lowercase keywords."""
+    # An empty keyword matches everything, which the automaton can't express
+    if ahocorasick is None or len(keywords) < KEYWORD_AUTOMATON_MIN or '' in keywords:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
 
 
 class SearchSort(Enum):
@@ -22,7 +144,7 @@ class SearchSort(Enum):
     UPDATED = "updated"
 
 
-@dataclass
+@dataclass(slots=True)
 class PackageInfo:
     """Information about a Chocolatey package."""
     name: str
@@ -31,13 +153,27 @@ class PackageInfo:
     summary: str = ""
     authors: str = ""
     downloads: int = 0
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     is_approved: bool = False
     is_trusted: bool = False
+    # How well the package matched the search query (higher is better)
+    relevance_score: int = field(default=0, repr=False, compare=False)
+    # Lowercased copies reused by filtering and sorting
+    name_ci: str = field(init=False, repr=False, compare=False)
+    desc_ci: str = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+        self.name_ci = self.name.lower()
+        self.desc_ci = self.description.lower()
+
+
+# Sort key and whether it sorts descending by default, per sort option
+_SORT_KEYS: Dict[SearchSort, Tuple[Callable[[PackageInfo], Any], bool]] = {
+    SearchSort.NAME: (attrgetter('name_ci'), False),
+    SearchSort.DOWNLOADS: (attrgetter('downloads'), True),
+    # Stable, so equally relevant packages keep Chocolatey's order
+    SearchSort.RELEVANCE: (attrgetter('relevance_score'), True),
+}
 
 
 class PackageSearcher:
@@ -48,8 +184,8 @@ class PackageSearcher:
     filtering and sorting options.
     """
     
-    def __init__(self):
-        self.chocolatey_manager = ChocolateyManager()
+    def __init__(self, manager: Optional[ChocolateyManager] = None):
+        self.chocolatey_manager = manager or get_default_manager()
     
     def search_packages(
         self,
@@ -78,133 +214,185 @@ class PackageSearcher:
         if not query.strip():
             return False, [], "Search query cannot be empty"
         
+        # choco matches case-insensitively, so equivalent queries share an entry
+        cache_key = (query.strip().lower(), exact_match, limit, include_prereleases, approved_only)
+        with _search_cache_lock:
+            cached = _search_cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < SEARCH_CACHE_TTL:
+                    _search_cache.move_to_end(cache_key)
+                    success, packages, error_message = cached[1]
+                    return success, list(packages), error_message
+                del _search_cache[cache_key]
+        
+        result = self._search_packages(query, exact_match, limit, include_prereleases, approved_only)
+        if result[0]:
+            with _search_cache_lock:
+                _search_cache[cache_key] = (time.monotonic(), result)
+                if len(_search_cache) > SEARCH_CACHE_SIZE:
+                    _search_cache.popitem(last=False)
+            return result[0], list(result[1]), result[2]
+        return result
+    
+    def _search_packages(
+        self,
+        query: str,
+        exact_match: bool,
+        limit: int,
+        include_prereleases: bool,
+        approved_only: bool
+    ) -> Tuple[bool, List[PackageInfo], str]:
+        """
+        Run a Chocolatey search without consulting the result cache.
+        
+        "choco search" is tried first, then "choco list" as a fallback; the
+        first command that succeeds provides the results.
+        """
         try:
             # Build search command
-            cmd_parts = ["choco", "search", f'"{query}"']
+            search_cmd = [_choco_executable(), "search", query]
             
             if exact_match:
-                cmd_parts.append("--exact")
+                search_cmd.append("--exact")
             
             if include_prereleases:
-                cmd_parts.append("--prerelease")
+                search_cmd.append("--prerelease")
             
             if approved_only:
-                cmd_parts.append("--approved-only")
+                search_cmd.append("--approved-only")
             
-            cmd_parts.extend(["--limit-output", f"--page-size={limit}"])
+            search_cmd.extend(["--limit-output", f"--page-size={limit}"])
             
-            cmd = " ".join(cmd_parts)
+            # Alternative search method
+            list_cmd = [_choco_executable(), "list", query, "--limit-output"]
             
-            return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=60
-            )
-            
-            if return_code != 0:
-                # Try alternative search method
-                return self._fallback_search(query, exact_match, limit)
-            
-            # Parse results
-            packages = self._parse_search_results(stdout, query, exact_match, limit)
+            matcher = self._query_matcher(query, exact_match)
+            failures = []
+            for cmd_parts in (search_cmd, list_cmd):
+                return_code, packages, stderr = self._stream_search(cmd_parts, matcher, limit, timeout=60)
+                if return_code == 0:
+                    return True, packages, ""
+                failure = f"choco {cmd_parts[1]} exited with code {return_code}"
+                failures.append(f"{failure}: {stderr}" if stderr else failure)
             
-            return True, packages, ""
+            return False, [], f"Search failed: {'; '.join(failures)}"
             
         except Exception as e:
             return False, [], f"Search error: {str(e)}"
     
-    def _fallback_search(
-        self, 
-        query: str, 
-        exact_match: bool, 
-        limit: int
-    ) -> Tuple[bool, List[PackageInfo], str]:
+    def _stream_search(
+        self,
+        cmd_parts: List[str],
+        matcher: Callable[[str, str], int],
+        limit: int,
+        timeout: int
+    ) -> Tuple[int, List[PackageInfo], str]:
         """
-        Fallback search method using choco list.
+        Run a search command, parsing results as they are printed.
         
-        Args:
-            query: Search query
-            exact_match: Whether to use exact matching
-            limit: Result limit
+        choco is stopped as soon as limit matching packages have been read,
+        so neither it nor the parser handles results that would be dropped.
         
         Returns:
-            Tuple[bool, List[PackageInfo], str]: (success, packages, error_message)
+            Tuple[int, List[PackageInfo], str]: (return_code, packages,
+            stderr_tail), with a return code of 0 when choco was stopped at
+            the limit and the last SEARCH_STDERR_LINES of stderr joined
+        
+        Raises:
+            subprocess.TimeoutExpired: If the search times out
         """
+        proc = subprocess.Popen(
+            cmd_parts,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            errors='replace'
+        )
+        stderr_tail = deque(maxlen=SEARCH_STDERR_LINES)
+        timed_out = threading.Event()
+        
+        def kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+        
+        # Drain stderr separately so a full pipe can never block the process
+        stderr_reader = threading.Thread(
+            target=lambda: stderr_tail.extend(line.strip() for line in proc.stderr if line.strip()),
+            daemon=True
+        )
+        watchdog = threading.Timer(timeout, kill_on_timeout)
+        stderr_reader.start()
+        watchdog.start()
+        
+        packages = []
         try:
-            cmd = f'choco list "{query}" --limit-output'
-            
-            return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=60
-            )
-            
-            if return_code == 0:
-                packages = self._parse_search_results(stdout, query, exact_match, limit)
-                return True, packages, ""
-            else:
-                return False, [], f"Fallback search failed: {stderr}"
-                
-        except Exception as e:
-            return False, [], f"Fallback search error: {str(e)}"
+            for line in proc.stdout:
+                package_info = self._parse_search_line(line, matcher)
+                if package_info is None:
+                    continue
+                packages.append(package_info)
+                if len(packages) >= limit:
+                    proc.terminate()
+                    break
+            proc.wait()
+            stderr_reader.join()
+        finally:
+            watchdog.cancel()
+            proc.stdout.close()
+            proc.stderr.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd_parts, timeout)
+        
+        if len(packages) >= limit:
+            return 0, packages, ""
+        return proc.returncode, packages, " | ".join(stderr_tail)
     
-    def _parse_search_results(
-        self, 
-        output: str, 
-        query: str, 
-        exact_match: bool, 
-        limit: int
-    ) -> List[PackageInfo]:
+    @staticmethod
+    def _query_matcher(query: str, exact_match: bool) -> Callable[[str, str], int]:
         """
-        Parse Chocolatey search output into PackageInfo objects.
-        
-        Args:
-            output: Raw search output
-            query: Original search query
-            exact_match: Whether exact matching was requested
-            limit: Maximum number of results
+        Build a scorer telling how well a (name, description) matches the query.
         
-        Returns:
-            List[PackageInfo]: Parsed package information
+        The score counts query occurrences in the name and description; 0
+        means no match.
         """
-        packages = []
-        query_lower = query.lower()
+        if exact_match:
+            query_folded = query.casefold()
+            return lambda name, description: int(name.casefold() == query_folded)
         
-        for line in output.splitlines():
-            if not line.strip():
-                continue
-                
-            parts = line.split('|')
-            if len(parts) < 2:
-                continue
-            
-            package_name = parts[0].strip()
-            version = parts[1].strip()
-            description = parts[2].strip() if len(parts) > 2 else "No description available"
-            
-            # Apply filtering
-            package_name_lower = package_name.lower()
-            
-            if exact_match:
-                if package_name_lower != query_lower:
-                    continue
-            else:
-                # Check if query matches package name or description
-                if (query_lower not in package_name_lower and 
-                    query_lower not in description.lower()):
-                    continue
-            
-            # Create package info
-            package_info = PackageInfo(
-                name=package_name,
-                version=version,
-                description=description,
-                summary=description[:100] + "..." if len(description) > 100 else description
-            )
-            
-            packages.append(package_info)
-            
-            # Respect limit
-            if len(packages) >= limit:
-                break
+        # Check if query matches package name or description
+        query_re = re.compile(re.escape(query), re.IGNORECASE)
+        return lambda name, description: len(query_re.findall(name)) + len(query_re.findall(description))
+    
+    @staticmethod
+    def _parse_search_line(line: str, matcher: Callable[[str, str], int]) -> Optional[PackageInfo]:
+        """Parse one "name|version|description" line, if it matches the query."""
+        # Only the first three fields are used; descriptions may contain pipes
+        package_name, sep, rest = line.partition('|')
+        if not sep:
+            return None
+        version, sep, description = rest.partition('|')
+        
+        # Names and versions recur across searches; descriptions are too varied to intern
+        package_name = sys.intern(package_name.strip())
+        version = sys.intern(version.strip())
+        description = description.strip() if sep else "No description available"
+        
+        # Apply filtering
+        score = matcher(package_name, description)
+        if not score:
+            return None
         
-        return packages
+        return PackageInfo(
+            name=package_name,
+            version=version,
+            description=description,
+            summary=(
+                description if len(description) <= SUMMARY_MAX_LENGTH
+                else f"{description[:SUMMARY_MAX_LENGTH]}..."
+            ),
+            relevance_score=score
+        )
     
     def get_package_details(self, package_name: str) -> Tuple[bool, Optional[PackageInfo], str]:
         """
@@ -217,30 +405,198 @@ class PackageSearcher:
             Tuple[bool, Optional[PackageInfo], str]: (success, package_info, error_message)
         """
         try:
-            cmd = f'choco info "{package_name}" --limit-output'
+            try:
+                stdout = _raw_package_info(package_name)
+            except RuntimeError:
+                stdout = ""
             
-            return_code, stdout, stderr = run_command_with_timeout(
-                cmd, timeout=30
-            )
-            
-            if return_code == 0 and stdout.strip():
-                # Parse the info output
-                lines = stdout.strip().split('\n')
-                if lines:
-                    parts = lines[0].split('|')
-                    if len(parts) >= 2:
-                        package_info = PackageInfo(
-                            name=parts[0].strip(),
-                            version=parts[1].strip(),
-                            description=parts[2].strip() if len(parts) > 2 else "No description available"
-                        )
-                        return True, package_info, ""
-            
-            return False, None, f"Package '{package_name}' not found"
+            return self._parse_package_details(stdout, package_name)
             
         except Exception as e:
             return False, None, f"Error getting package details: {str(e)}"
     
+    @staticmethod
+    def _parse_package_details(output: str, package_name: str) -> Tuple[bool, Optional[PackageInfo], str]:
+        """Parse "choco info --limit-output" output into a get_package_details result."""
+        # Prefer the line for the requested package, else the first package line
+        target = package_name.lower()
+        match = None
+        for line in output.splitlines():
+            head, sep, _ = line.partition('|')
+            if not sep:
+                continue
+            if head.strip().lower() == target:
+                match = line
+                break
+            if match is None:
+                match = line
+        
+        if match is not None:
+            parts = match.split('|', 2)
+            package_info = PackageInfo(
+                name=sys.intern(parts[0].strip()),
+                version=sys.intern(parts[1].strip()),
+                description=parts[2].strip() if len(parts) > 2 else "No description available"
+            )
+            return True, package_info, ""
+        
+        return False, None, f"Package '{package_name}' not found"
+    
+    def get_package_details_batch(
+        self,
+        package_names: List[str],
+        on_result: Optional[Callable[[str, Tuple[bool, Optional[PackageInfo], str]], None]] = None
+    ) -> Dict[str, Tuple[bool, Optional[PackageInfo], str]]:
+        """
+        Get detailed information about many packages at once.
+        
+        Up to DETAILS_CONCURRENCY "choco info" processes run concurrently, and
+        results are collected as each one finishes rather than in order.
+        
+        Args:
+            package_names: Names of the packages
+            on_result: Called with (package_name, result) as each lookup finishes
+        
+        Returns:
+            Dict[str, Tuple[bool, Optional[PackageInfo], str]]: get_package_details
+            style results keyed by package name
+        """
+        return asyncio.run(self.get_package_details_batch_async(package_names, on_result))
+    
+    async def get_package_details_batch_async(
+        self,
+        package_names: List[str],
+        on_result: Optional[Callable[[str, Tuple[bool, Optional[PackageInfo], str]], None]] = None
+    ) -> Dict[str, Tuple[bool, Optional[PackageInfo], str]]:
+        """Awaitable form of get_package_details_batch, for callers already in an event loop."""
+        semaphore = asyncio.Semaphore(DETAILS_CONCURRENCY)
+        lookups = [
+            self._fetch_package_details(name, semaphore)
+            for name in dict.fromkeys(package_names)
+        ]
+        
+        results = {}
+        for lookup in asyncio.as_completed(lookups):
+            package_name, result = await lookup
+            results[package_name] = result
+            if on_result is not None:
+                on_result(package_name, result)
+        return results
+    
+    async def _fetch_package_details(
+        self,
+        package_name: str,
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[str, Tuple[bool, Optional[PackageInfo], str]]:
+        """Run one "choco info" lookup once a concurrency slot is free (cached ones need none)."""
+        cached = _cached_package_info(package_name)
+        if cached is not None:
+            return package_name, self._parse_package_details(cached, package_name)
+        
+        async with semaphore:
+            try:
+                proc = await asyncio.create_subprocess_exec(
+                    _choco_executable(), "info", package_name, "--limit-output",
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+                try:
+                    stdout, _ = await asyncio.wait_for(proc.communicate(), DETAILS_TIMEOUT)
+                except asyncio.TimeoutError:
+                    proc.kill()
+                    await proc.wait()
+                    return package_name, (
+                        False, None, f"Error getting package details: timed out after {DETAILS_TIMEOUT} seconds"
+                    )
+                
+                output = stdout.decode(locale.getpreferredencoding(False), errors='replace')
+                if proc.returncode == 0:
+                    _cache_package_info(package_name, output)
+                else:
+                    output = ""
+                return package_name, self._parse_package_details(output, package_name)
+                
+            except Exception as e:
+                return package_name, (False, None, f"Error getting package details: {str(e)}")
+    
+    def get_package_details_bulk(self, package_names: List[str]) -> Dict[str, Optional[PackageInfo]]:
+        """
+        Look up many packages with a few queries against the Chocolatey feed.
+        
+        Instead of one "choco info" process per package, ids are sent
+        BULK_QUERY_CHUNK at a time as a single OData filter on the feed.
+        
+        Args:
+            package_names: Names of the packages
+        
+        Returns:
+            Dict[str, Optional[PackageInfo]]: Latest package information keyed by
+            requested name, or None for packages the feed doesn't have
+        
+        Raises:
+            OSError: If the feed can't be reached
+            ET.ParseError: If the feed response is malformed
+        """
+        found: Dict[str, PackageInfo] = {}
+        ids = list(dict.fromkeys(name.lower() for name in package_names))
+        
+        for start in range(0, len(ids), BULK_QUERY_CHUNK):
+            id_filter = " or ".join(
+                "tolower(Id) eq '{}'".format(package_id.replace("'", "''"))
+                for package_id in ids[start:start + BULK_QUERY_CHUNK]
+            )
+            query = urllib.parse.urlencode(
+                {'$filter': f"({id_filter}) and IsLatestVersion"}, quote_via=urllib.parse.quote
+            )
+            url = f"{CHOCOLATEY_SOURCE}/Packages()?{query}"
+            
+            # Follow the feed's paging links until the chunk is exhausted
+            while url:
+                with urllib.request.urlopen(url, timeout=DETAILS_TIMEOUT) as response:
+                    feed = ET.parse(response).getroot()
+                for entry in feed.iterfind('atom:entry', _ODATA_NS):
+                    package_info = self._parse_feed_entry(entry)
+                    found[package_info.name_ci] = package_info
+                next_link = feed.find("atom:link[@rel='next']", _ODATA_NS)
+                url = next_link.get('href') if next_link is not None else None
+        
+        return {name: found.get(name.lower()) for name in package_names}
+    
+    @staticmethod
+    def _parse_feed_entry(entry: ET.Element) -> PackageInfo:
+        """Build a PackageInfo from one Atom entry of the OData package feed."""
+        properties = entry.find('m:properties', _ODATA_NS)
+        
+        def prop(name: str, default: str = "") -> str:
+            value = properties.findtext(f'd:{name}', None, _ODATA_NS) if properties is not None else None
+            return value or default
+        
+        description = prop('Description', "No description available").strip()
+        downloads = prop('DownloadCount', "0")
+        
+        return PackageInfo(
+            name=sys.intern(prop('Id') or entry.findtext('atom:title', '', _ODATA_NS).strip()),
+            version=sys.intern(prop('Version')),
+            description=description,
+            summary=prop('Summary') or (
+                description if len(description) <= SUMMARY_MAX_LENGTH
+                else f"{description[:SUMMARY_MAX_LENGTH]}..."
+            ),
+            authors=entry.findtext('atom:author/atom:name', '', _ODATA_NS),
+            downloads=int(downloads) if downloads.isdigit() else 0,
+            tags=prop('Tags').split(),
+            is_approved=prop('IsApproved') == 'true'
+        )
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Forget cached search results, package details and the choco path."""
+        with _search_cache_lock:
+            _search_cache.clear()
+        with _details_cache_lock:
+            _details_cache.clear()
+        _choco_executable.cache_clear()
+    
     def validate_package_name(self, package_name: str) -> Tuple[bool, str]:
         """
         Validate a package name format.
@@ -254,14 +610,16 @@ class PackageSearcher:
         if not package_name or not package_name.strip():
             return False, "Package name cannot be empty"
         
-        # Basic validation - package names should be alphanumeric with dots, hyphens, underscores
-        if not re.match(r'^[a-zA-Z0-9._-]+$', package_name.strip()):
-            return False, "Package name contains invalid characters"
+        # One match covers both the character set and the length limit
+        name = package_name.strip()
+        if _PACKAGE_NAME_RE.match(name):
+            return True, ""
         
-        if len(package_name) > 100:
-            return False, "Package name too long (max 100 characters)"
+        # Stripping every allowed character leaves nothing if only the length is wrong
+        if name.strip(_PACKAGE_NAME_CHARS):
+            return False, "Package name contains invalid characters"
         
-        return True, ""
+        return False, f"Package name too long (max {MAX_PACKAGE_NAME_LENGTH} characters)"
     
     def filter_packages(
         self, 
@@ -278,26 +636,29 @@ class PackageSearcher:
         Returns:
             List[PackageInfo]: Filtered packages
         """
-        filtered = packages.copy()
-        
-        # Filter by name pattern
-        if 'name_pattern' in filters:
-            pattern = filters['name_pattern'].lower()
-            filtered = [p for p in filtered if pattern in p.name.lower()]
-        
-        # Filter by description keywords
-        if 'description_keywords' in filters:
-            keywords = [kw.lower() for kw in filters['description_keywords']]
-            filtered = [
-                p for p in filtered 
-                if any(kw in p.description.lower() for kw in keywords)
-            ]
-        
-        # Filter by approval status
-        if filters.get('approved_only', False):
-            filtered = [p for p in filtered if p.is_approved]
-        
-        return filtered
+        name_pattern = filters['name_pattern'].lower() if 'name_pattern' in filters else None
+        keywords = (
+            tuple(kw.lower() for kw in filters['description_keywords'])
+            if 'description_keywords' in filters else None
+        )
+        approved_only = filters.get('approved_only', False)
+        
+        # Many keywords are matched in one pass over each description
+        automaton = _keyword_automaton(keywords) if keywords else None
+        if automaton is not None:
+            def has_keyword(description: str) -> bool:
+                return next(automaton.iter(description), None) is not None
+        else:
+            def has_keyword(description: str) -> bool:
+                return any(kw in description for kw in keywords)
+        
+        # Single pass, cheapest predicate first
+        return [
+            p for p in packages
+            if (not approved_only or p.is_approved)
+            and (name_pattern is None or name_pattern in p.name_ci)
+            and (keywords is None or has_keyword(p.desc_ci))
+        ]
     
     def sort_packages(
         self, 
@@ -316,12 +677,9 @@ class PackageSearcher:
         Returns:
             List[PackageInfo]: Sorted packages
         """
-        if sort_by == SearchSort.NAME:
-            return sorted(packages, key=lambda p: p.name.lower(), reverse=reverse)
-        elif sort_by == SearchSort.DOWNLOADS:
-            return sorted(packages, key=lambda p: p.downloads, reverse=not reverse)
-        else:  # RELEVANCE or default
-            return packages  # Keep original order for relevance
+        # Options without their own key (e.g. UPDATED) fall back to relevance
+        key, descending = _SORT_KEYS.get(sort_by, _SORT_KEYS[SearchSort.RELEVANCE])
+        return sorted(packages, key=key, reverse=reverse ^ descending)
 
 
 class PackageSearchWorker(BaseWorker):
@@ -381,6 +739,10 @@ class PackageSearchWorker(BaseWorker):
                     reverse = self.search_options.get('sort_reverse', False)
                     packages = self.searcher.sort_packages(packages, sort_by, reverse)
                 
+                # Replace search hits with their full details if requested
+                if self.search_options.get('fetch_details') and packages:
+                    packages = self._fetch_details(packages)
+                
                 self.signals.emit_progress(f"Found {len(packages)} packages matching '{self.query}'")
                 
                 if len(packages) == 0:
@@ -395,6 +757,25 @@ class PackageSearchWorker(BaseWorker):
         except Exception as e:
             self.signals.emit_error(f"Search error: {str(e)}")
     
+    def _fetch_details(self, packages: List[PackageInfo]) -> List[PackageInfo]:
+        """Look up details for all packages concurrently, reporting each as it completes."""
+        total = len(packages)
+        completed = 0
+        
+        def report(package_name: str, result: Tuple[bool, Optional[PackageInfo], str]) -> None:
+            nonlocal completed
+            completed += 1
+            self.signals.emit_progress(f"Fetched details for {package_name} ({completed}/{total})")
+        
+        details = self.searcher.get_package_details_batch([p.name for p in packages], report)
+        
+        # Keep the search hit for packages whose details could not be fetched
+        return [details[p.name][1] if details[p.name][0] else p for p in packages]
+    
+    async def run_async(self) -> None:
+        """Search from an asyncio event loop without blocking it."""
+        await asyncio.to_thread(self.run)
+    
     def get_search_summary(self) -> Dict[str, any]:
         """
         Get summary information about the search operation.
@@ -6,17 +6,61 @@ software packages, including preset validation, package verification, and
 preset recommendations.
 """
 
-from typing import List, Dict, Set, Tuple, Optional
-from dataclasses import dataclass
+from typing import List, Dict, Set, Tuple, Optional, Iterator, Mapping
+from types import MappingProxyType
+from dataclasses import dataclass, field
 from enum import Enum
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter
+from contextlib import closing
+from itertools import chain
+from datetime import datetime
+import os
+import difflib
 import json
+import time
+import sqlite3
 from pathlib import Path
 
-from core import ConfigManager
-from .chocolatey_manager import ChocolateyManager
+# Optional C-backed JSON encoder/decoder for preset export and import
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional C++-backed fuzzy matcher for package suggestions
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+except ImportError:
+    fuzz = fuzz_process = None
+
+from core import ConfigManager, PACKAGE_CACHE_DIR_NAME
+from .chocolatey_manager import ChocolateyManager, get_default_manager
 from .package_search import PackageSearcher, PackageInfo
 
 
+# Package lookups are I/O-bound, so validation runs this many at once
+VALIDATION_WORKERS = 16
+
+# Package relationships used for recommendations
+_RECOMMENDATION_RULES: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    'googlechrome': ('firefox', 'chromium'),
+    'firefox': ('googlechrome', 'thunderbird'),
+    'vscode': ('git', 'nodejs', 'python'),
+    'git': ('vscode', 'github-desktop', 'gitextensions'),
+    'nodejs': ('vscode', 'yarn', 'npm'),
+    'python': ('vscode', 'pip', 'anaconda3'),
+    'vlc': ('k-litecodecpackfull', 'obs-studio'),
+    '7zip': ('winrar', 'peazip'),
+    'steam': ('discord', 'nvidia-geforce-experience'),
+    'discord': ('steam', 'obs-studio'),
+})
+MAX_RECOMMENDATIONS = 10
+
+# Packages confirmed to exist are trusted for this long without re-checking
+PACKAGE_INDEX_TTL = 3600  # seconds
+
+
 class PresetCategory(Enum):
     """Preset category enumeration."""
     OFFICE = "office"
@@ -28,7 +72,7 @@ class PresetCategory(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PresetValidationResult:
     """Result of preset validation."""
     preset_name: str
@@ -39,7 +83,7 @@ class PresetValidationResult:
     is_valid: bool
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PresetInfo:
     """Extended preset information."""
     name: str
@@ -49,13 +93,99 @@ class PresetInfo:
     author: str = ""
     created_date: str = ""
     last_modified: str = ""
-    tags: List[str] = None
+    tags: List[str] = field(default_factory=list)
     estimated_install_time: int = 0  # in minutes
     estimated_size_mb: int = 0
+
+
+class _PresetNotFound(Exception):
+    """Raised internally when a preset to combine doesn't exist."""
+    
+    def __init__(self, preset_name: str):
+        super().__init__(preset_name)
+        self.preset_name = preset_name
+
+
+class PackageIndex:
+    """
+    SQLite index of packages recently confirmed to exist in the Chocolatey source.
+    
+    Validation answers packages with a fresh entry locally, so presets
+    checked within the TTL don't query Chocolatey again.
+    """
+    
+    def __init__(self, db_path: Path, ttl_seconds: int = PACKAGE_INDEX_TTL):
+        self.db_path = db_path
+        self.ttl_seconds = ttl_seconds
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the index database, creating it if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS packages ("
+            "name TEXT PRIMARY KEY, last_seen_version TEXT NOT NULL, "
+            "fetched_at INTEGER NOT NULL)"
+        )
+        return conn
+    
+    def lookup(self, package_names: List[str]) -> Set[str]:
+        """
+        Get the (lowercased) names among package_names with a fresh entry.
+        
+        Index errors are treated as an empty index.
+        """
+        names = list({name.lower() for name in package_names})
+        cutoff = int(time.time()) - self.ttl_seconds
+        found = set()
+        
+        try:
+            with closing(self._connect()) as conn:
+                # Stay well under SQLite's bound-parameter limit
+                for start in range(0, len(names), 500):
+                    chunk = names[start:start + 500]
+                    placeholders = ", ".join("?" * len(chunk))
+                    found.update(row[0] for row in conn.execute(
+                        f"SELECT name FROM packages WHERE fetched_at >= ? AND name IN ({placeholders})",
+                        (cutoff, *chunk)
+                    ))
+        except (sqlite3.Error, OSError):
+            return set()
+        
+        return found
+    
+    def record(self, packages: Dict[str, str], replace_all: bool = False) -> None:
+        """
+        Record packages (name -> version) as existing, in one transaction.
+        
+        Args:
+            packages: Packages confirmed to exist, with their latest version
+            replace_all: Whether to drop every other entry first
+        """
+        now = int(time.time())
+        rows = [(name.lower(), version or "", now) for name, version in packages.items()]
+        
+        try:
+            with closing(self._connect()) as conn, conn:
+                if replace_all:
+                    conn.execute("DELETE FROM packages")
+                conn.executemany("INSERT OR REPLACE INTO packages VALUES (?, ?, ?)", rows)
+        except (sqlite3.Error, OSError):
+            pass  # The index is only an optimization
     
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+    def known_packages(self) -> List[str]:
+        """Get the names of all indexed packages, fresh or not."""
+        try:
+            with closing(self._connect()) as conn:
+                return [row[0] for row in conn.execute("SELECT name FROM packages")]
+        except (sqlite3.Error, OSError):
+            return []
+
+
+def _default_package_index() -> PackageIndex:
+    """Get the package index kept alongside the local package cache."""
+    local_app_data = os.environ.get('LOCALAPPDATA') or str(Path.home())
+    return PackageIndex(Path(local_app_data) / PACKAGE_CACHE_DIR_NAME / "package_index.db")
 
 
 class PresetsManager:
@@ -66,10 +196,16 @@ class PresetsManager:
     with software-specific features like package validation and recommendations.
     """
     
-    def __init__(self, config_manager: ConfigManager):
+    def __init__(
+        self,
+        config_manager: ConfigManager,
+        manager: Optional[ChocolateyManager] = None,
+        package_index: Optional[PackageIndex] = None
+    ):
         self.config_manager = config_manager
-        self.chocolatey_manager = ChocolateyManager()
-        self.package_searcher = PackageSearcher()
+        self.chocolatey_manager = manager or get_default_manager()
+        self.package_searcher = PackageSearcher(self.chocolatey_manager)
+        self.package_index = package_index or _default_package_index()
     
     def validate_preset(self, preset_name: str) -> PresetValidationResult:
         """
@@ -92,52 +228,126 @@ class PresetsManager:
                 is_valid=False
             )
         
-        valid_packages = []
-        invalid_packages = []
-        missing_packages = []
-        warnings = []
-        
         # Check if Chocolatey is available for validation
         if not self.chocolatey_manager.is_chocolatey_installed():
-            warnings.append("Chocolatey not installed - cannot validate package availability")
             return PresetValidationResult(
                 preset_name=preset_name,
                 valid_packages=packages,  # Assume valid if can't check
                 invalid_packages=[],
                 missing_packages=[],
-                warnings=warnings,
+                warnings=["Chocolatey not installed - cannot validate package availability"],
                 is_valid=True
             )
         
-        # Validate each package
+        return self._build_validation_result(preset_name, packages, self._check_packages(packages))
+    
+    def _check_package(self, package: str) -> Tuple[str, str]:
+        """
+        Check whether a single package is available.
+        
+        Returns:
+            Tuple[str, str]: (status, warning) - status is 'valid', 'missing' or 'invalid'
+        """
+        try:
+            success, package_info, error = self.package_searcher.get_package_details(package)
+            
+            if success and package_info:
+                return 'valid', ""
+            
+            # Try a search to see if package exists with different name
+            search_success, search_results, search_error = self.package_searcher.search_packages(
+                package, exact_match=True, limit=1
+            )
+            
+            if search_success and search_results:
+                return 'valid', ""
+            return 'missing', ""
+            
+        except Exception as e:
+            return 'invalid', f"Error validating package '{package}': {str(e)}"
+    
+    def _check_packages(self, packages: List[str]) -> List[Tuple[str, str]]:
+        """
+        Check packages, returning _check_package results in order.
+        
+        Packages with a fresh package index entry are valid without a query.
+        One bulk feed query settles most of the rest; only those it doesn't
+        find (or all of them, if the feed can't be queried) are checked one
+        by one, concurrently. Packages found valid are recorded in the index.
+        """
+        if not packages:
+            return []
+        
+        # Chocolatey ids are case-insensitive, so each is looked up only once
+        indexed = self.package_index.lookup(packages)
+        unknown = {}
         for package in packages:
-            try:
-                success, package_info, error = self.package_searcher.get_package_details(package)
-                
-                if success and package_info:
-                    valid_packages.append(package)
-                else:
-                    # Try a search to see if package exists with different name
-                    search_success, search_results, search_error = self.package_searcher.search_packages(
-                        package, exact_match=True, limit=1
-                    )
-                    
-                    if search_success and search_results:
-                        valid_packages.append(package)
-                    else:
-                        missing_packages.append(package)
-                        
-            except Exception as e:
-                warnings.append(f"Error validating package '{package}': {str(e)}")
-                invalid_packages.append(package)
-        
-        is_valid = len(invalid_packages) == 0 and len(missing_packages) == 0
+            key = package.lower()
+            if key not in indexed:
+                unknown.setdefault(key, package)
+        if not unknown:
+            return [('valid', "")] * len(packages)
+        
+        try:
+            found = self.package_searcher.get_package_details_bulk(list(unknown.values()))
+        except Exception:
+            found = {}
+        confirmed = {name: info.version for name, info in found.items() if info is not None}
+        
+        remaining = [name for name in unknown.values() if name not in confirmed]
+        checks = {}
+        if remaining:
+            with ThreadPoolExecutor(max_workers=min(VALIDATION_WORKERS, len(remaining))) as executor:
+                checks = {
+                    name.lower(): result
+                    for name, result in zip(remaining, executor.map(self._check_package, remaining))
+                }
+        
+        confirmed.update((name, "") for name, (status, _) in checks.items() if status == 'valid')
+        if confirmed:
+            self.package_index.record(confirmed)
+        
+        return [checks.get(p.lower(), ('valid', "")) for p in packages]
+    
+    def refresh_package_index(self) -> int:
+        """
+        Re-check every package in the package index with bulk feed queries.
+        
+        Packages the feed no longer has are dropped from the index.
+        
+        Returns:
+            int: Number of packages left in the index
+        
+        Raises:
+            OSError: If the feed can't be reached
+        """
+        found = self.package_searcher.get_package_details_bulk(self.package_index.known_packages())
+        confirmed = {name: info.version for name, info in found.items() if info is not None}
+        self.package_index.record(confirmed, replace_all=True)
+        return len(confirmed)
+    
+    @staticmethod
+    def _build_validation_result(
+        preset_name: str,
+        packages: List[str],
+        checks: List[Tuple[str, str]]
+    ) -> PresetValidationResult:
+        """Sort checked packages into a PresetValidationResult."""
+        buckets = {'valid': [], 'invalid': [], 'missing': []}
+        warnings = []
+        
+        for package, (status, warning) in zip(packages, checks):
+            buckets[status].append(package)
+            if warning:
+                warnings.append(warning)
+        
+        is_valid = len(buckets['invalid']) == 0 and len(buckets['missing']) == 0
         
         return PresetValidationResult(
             preset_name=preset_name,
-            valid_packages=valid_packages,
-            invalid_packages=invalid_packages,
-            missing_packages=missing_packages,
+            valid_packages=buckets['valid'],
+            invalid_packages=buckets['invalid'],
+            missing_packages=buckets['missing'],
             warnings=warnings,
             is_valid=is_valid
         )
@@ -149,13 +359,39 @@ class PresetsManager:
         Returns:
             Dict[str, PresetValidationResult]: Validation results for all presets
         """
-        results = {}
-        preset_names = self.config_manager.get_preset_names()
+        return dict(self.iter_validate_all_presets())
+    
+    def iter_validate_all_presets(self) -> Iterator[Tuple[str, PresetValidationResult]]:
+        """
+        Validate all presets, yielding results in preset order.
         
-        for preset_name in preset_names:
-            results[preset_name] = self.validate_preset(preset_name)
+        Every package of every preset is checked up front, in one shared
+        pool and only once even if several presets list it, so the first
+        result arrives once all checks are done. Results are then built one
+        preset at a time from the per-package status; callers that stream
+        them don't hold every preset's result at once.
         
-        return results
+        Yields:
+            Tuple[str, PresetValidationResult]: Preset name and its validation result
+        """
+        chocolatey_installed = self.chocolatey_manager.is_chocolatey_installed()
+        presets = {
+            preset_name: self.config_manager.get_preset(preset_name)
+            for preset_name in self.config_manager.get_preset_names()
+        }
+        
+        status = {}
+        if chocolatey_installed:
+            unique_packages = list(dict.fromkeys(chain.from_iterable(filter(None, presets.values()))))
+            status = dict(zip(unique_packages, self._check_packages(unique_packages)))
+        
+        for preset_name, packages in presets.items():
+            if packages and chocolatey_installed:
+                yield preset_name, self._build_validation_result(
+                    preset_name, packages, [status[p] for p in packages]
+                )
+            else:
+                yield preset_name, self.validate_preset(preset_name)
     
     def suggest_similar_packages(self, package_name: str, max_suggestions: int = 5) -> List[str]:
         """
@@ -168,8 +404,10 @@ class PresetsManager:
         Returns:
             List[str]: List of suggested package names
         """
+        # The package index only holds packages from the user's own presets,
+        # so it stands in for the repository only when that can't be searched
         if not self.chocolatey_manager.is_chocolatey_installed():
-            return []
+            return self._suggest_from_index(package_name, max_suggestions)
         
         suggestions = []
         
@@ -178,21 +416,37 @@ class PresetsManager:
             success, packages, error = self.package_searcher.search_packages(
                 package_name, exact_match=False, limit=max_suggestions * 2
             )
-            
-            if success:
-                # Filter and sort suggestions by relevance
-                for package_info in packages:
-                    if package_info.name.lower() != package_name.lower():
-                        suggestions.append(package_info.name)
-                        
-                        if len(suggestions) >= max_suggestions:
-                            break
-            
         except Exception:
-            pass  # Return empty list on error
+            success, packages = False, []
+        
+        if not success:
+            return self._suggest_from_index(package_name, max_suggestions)
+        
+        # Filter and sort suggestions by relevance
+        for package_info in packages:
+            if package_info.name.lower() != package_name.lower():
+                suggestions.append(package_info.name)
+                
+                if len(suggestions) >= max_suggestions:
+                    break
         
         return suggestions
     
+    def _suggest_from_index(self, package_name: str, max_suggestions: int) -> List[str]:
+        """Get names from the package index that closely resemble package_name."""
+        target = package_name.lower()
+        index_names = [name for name in self.package_index.known_packages() if name != target]
+        if not index_names:
+            return []
+        
+        if fuzz_process is not None:
+            matches = fuzz_process.extract(
+                target, index_names, scorer=fuzz.WRatio, limit=max_suggestions, score_cutoff=60
+            )
+            return [name for name, _, _ in matches]
+        
+        return difflib.get_close_matches(target, index_names, n=max_suggestions, cutoff=0.6)
+    
     def create_preset_from_installed(self, preset_name: str) -> Tuple[bool, str]:
         """
         Create a preset from currently installed packages.
@@ -233,22 +487,23 @@ class PresetsManager:
         Returns:
             Tuple[bool, str]: (success, message)
         """
-        all_packages = set()
-        
-        for preset_name in preset_names:
-            packages = self.config_manager.get_preset(preset_name)
-            if packages:
-                all_packages.update(packages)
-            else:
-                return False, f"Preset '{preset_name}' not found"
-        
-        merged_packages = list(all_packages)
+        try:
+            merged_packages = list(set().union(*map(self._require_preset, preset_names)))
+        except _PresetNotFound as e:
+            return False, f"Preset '{e.preset_name}' not found"
         
         if self.config_manager.add_preset(new_preset_name, merged_packages):
             return True, f"Created merged preset '{new_preset_name}' with {len(merged_packages)} packages"
         else:
             return False, "Failed to save merged preset"
     
+    def _require_preset(self, preset_name: str) -> List[str]:
+        """Get a preset's packages, raising _PresetNotFound if it is missing or empty."""
+        packages = self.config_manager.get_preset(preset_name)
+        if not packages:
+            raise _PresetNotFound(preset_name)
+        return packages
+    
     def get_preset_statistics(self) -> Dict[str, any]:
         """
         Get statistics about all presets.
@@ -256,7 +511,7 @@ class PresetsManager:
         Returns:
             Dict: Preset statistics
         """
-        presets = self.config_manager.get_presets()
+        presets = self.config_manager.presets
         
         if not presets:
             return {
@@ -269,28 +524,27 @@ class PresetsManager:
             }
         
         total_presets = len(presets)
-        total_packages = sum(len(packages) for packages in presets.values())
-        average_packages = total_packages / total_presets if total_presets > 0 else 0
         
-        # Find largest and smallest presets
-        largest_preset = max(presets.items(), key=lambda x: len(x[1]))
-        smallest_preset = min(presets.items(), key=lambda x: len(x[1]))
+        # Totals, largest/smallest presets and package counts in one pass
+        total_packages = 0
+        largest_preset = smallest_preset = None
+        package_counts = Counter()
+        for preset_name, packages in presets.items():
+            size = len(packages)
+            total_packages += size
+            if largest_preset is None or size > largest_preset[1]:
+                largest_preset = (preset_name, size)
+            if smallest_preset is None or size < smallest_preset[1]:
+                smallest_preset = (preset_name, size)
+            package_counts.update(packages)
         
-        # Find common packages across presets
-        all_packages = []
-        for packages in presets.values():
-            all_packages.extend(packages)
-        
-        package_counts = {}
-        for package in all_packages:
-            package_counts[package] = package_counts.get(package, 0) + 1
+        average_packages = total_packages / total_presets if total_presets > 0 else 0
         
-        # Get packages that appear in multiple presets
+        # Get packages that appear in multiple presets, most common first
         common_packages = [
-            package for package, count in package_counts.items() 
+            package for package, count in package_counts.most_common()
             if count > 1
         ]
-        common_packages.sort(key=lambda x: package_counts[x], reverse=True)
         
         return {
             'total_presets': total_presets,
@@ -298,28 +552,34 @@ class PresetsManager:
             'average_packages_per_preset': round(average_packages, 1),
             'largest_preset': {
                 'name': largest_preset[0],
-                'package_count': len(largest_preset[1])
+                'package_count': largest_preset[1]
             },
             'smallest_preset': {
                 'name': smallest_preset[0],
-                'package_count': len(smallest_preset[1])
+                'package_count': smallest_preset[1]
             },
             'common_packages': common_packages[:10]  # Top 10 most common
         }
     
-    def export_presets(self, file_path: Path, include_validation: bool = False) -> Tuple[bool, str]:
+    def export_presets(
+        self,
+        file_path: Path,
+        include_validation: bool = False,
+        pretty: bool = False
+    ) -> Tuple[bool, str]:
         """
         Export presets to a JSON file with optional validation data.
         
         Args:
             file_path: Path to export file
             include_validation: Whether to include validation results
+            pretty: Whether to indent the JSON for reading (larger and slower)
         
         Returns:
             Tuple[bool, str]: (success, message)
         """
         try:
-            presets = self.config_manager.get_presets()
+            presets = self.config_manager.presets
             
             export_data = {
                 'presets': presets,
@@ -331,7 +591,6 @@ class PresetsManager:
             }
             
             if include_validation:
-                validation_results = self.validate_all_presets()
                 export_data['validation_results'] = {
                     name: {
                         'is_valid': result.is_valid,
@@ -340,11 +599,26 @@ class PresetsManager:
                         'missing_packages': result.missing_packages,
                         'warnings': result.warnings
                     }
-                    for name, result in validation_results.items()
+                    for name, result in self.iter_validate_all_presets()
                 }
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(export_data, option=orjson.OPT_INDENT_2 if pretty else 0)
+            elif pretty:
+                data = json.dumps(export_data, indent=2, ensure_ascii=False).encode('utf-8')
+            else:
+                data = json.dumps(export_data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            
+            file_path = Path(file_path)
+            # Write beside the target and swap it in, so an interrupted
+            # export never leaves a truncated file behind
+            tmp_path = file_path.with_suffix(file_path.suffix + '.tmp')
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, file_path)
+            except OSError:
+                tmp_path.unlink(missing_ok=True)
+                raise
             
             return True, f"Presets exported to {file_path}"
             
@@ -363,18 +637,23 @@ class PresetsManager:
             Tuple[bool, str, Dict]: (success, message, import_summary)
         """
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                import_data = json.load(f)
+            if orjson is not None:
+                with open(file_path, 'rb') as f:
+                    import_data = orjson.loads(f.read())
+            else:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    import_data = json.load(f)
             
             if 'presets' not in import_data:
                 return False, "Invalid preset file format", {}
             
             imported_presets = import_data['presets']
-            existing_presets = self.config_manager.get_preset_names()
+            existing_presets = set(self.config_manager.get_preset_names())
             
             imported_count = 0
             skipped_count = 0
             updated_count = 0
+            to_write = {}
             
             for preset_name, packages in imported_presets.items():
                 if preset_name in existing_presets and not overwrite_existing:
@@ -386,7 +665,11 @@ class PresetsManager:
                 else:
                     imported_count += 1
                 
-                self.config_manager.add_preset(preset_name, packages)
+                to_write[preset_name] = packages
+            
+            # Save all accepted presets with a single write
+            if to_write and not self.config_manager.add_presets_bulk(to_write):
+                return False, "Import failed: could not save presets", {}
             
             summary = {
                 'imported': imported_count,
@@ -402,10 +685,10 @@ class PresetsManager:
         except Exception as e:
             return False, f"Import failed: {str(e)}", {}
     
-    def _get_current_timestamp(self) -> str:
-        """Get current timestamp as ISO string."""
-        from datetime import datetime
-        return datetime.now().isoformat()
+    @staticmethod
+    def _get_current_timestamp() -> str:
+        """Get current timestamp as ISO string, to the second."""
+        return datetime.now().isoformat(timespec='seconds')
     
     def get_package_recommendations(self, installed_packages: List[str]) -> List[str]:
         """
@@ -420,26 +703,15 @@ class PresetsManager:
         # This is a simple implementation - could be enhanced with ML or more sophisticated logic
         recommendations = []
         
-        # Define package relationships and recommendations
-        recommendation_rules = {
-            'googlechrome': ['firefox', 'chromium'],
-            'firefox': ['googlechrome', 'thunderbird'],
-            'vscode': ['git', 'nodejs', 'python'],
-            'git': ['vscode', 'github-desktop', 'gitextensions'],
-            'nodejs': ['vscode', 'yarn', 'npm'],
-            'python': ['vscode', 'pip', 'anaconda3'],
-            'vlc': ['k-litecodecpackfull', 'obs-studio'],
-            '7zip': ['winrar', 'peazip'],
-            'steam': ['discord', 'nvidia-geforce-experience'],
-            'discord': ['steam', 'obs-studio'],
-        }
-        
-        installed_lower = [pkg.lower() for pkg in installed_packages]
+        # Installed and already recommended packages are never recommended
+        seen = {pkg.lower() for pkg in installed_packages}
         
-        for installed_pkg in installed_lower:
-            if installed_pkg in recommendation_rules:
-                for recommended_pkg in recommendation_rules[installed_pkg]:
-                    if recommended_pkg not in installed_lower and recommended_pkg not in recommendations:
-                        recommendations.append(recommended_pkg)
+        for installed_pkg in installed_packages:
+            for recommended_pkg in _RECOMMENDATION_RULES.get(installed_pkg.lower(), ()):
+                if recommended_pkg not in seen:
+                    seen.add(recommended_pkg)
+                    recommendations.append(recommended_pkg)
+                    if len(recommendations) >= MAX_RECOMMENDATIONS:
+                        return recommendations
         
-        return recommendations[:10]  # Return top 10 recommendations
\ No newline at end of file
+        return recommendations
@@ -5,12 +5,20 @@ This module provides comprehensive hardware detection capabilities including
 CPU, memory, storage, GPU, and system identification information.
 """
 
+import csv
 import subprocess
 import shutil
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
-from core import query_wmic, run_command_with_timeout, safe_get_env_var
+from core import query_wmic, run_command_with_timeout, safe_get_env_var, WMI_QUERY_TIMEOUT
+
+
+# Every CPU property in one WMI query, so detection starts a single wmic process
+CPU_WMIC_QUERY = (
+    "wmic cpu get Name,NumberOfCores,NumberOfLogicalProcessors,Architecture,"
+    "MaxClockSpeed,CurrentClockSpeed,Manufacturer /format:csv"
+)
 
 
 @dataclass
@@ -84,15 +92,10 @@ class HardwareDetector:
             CPUInfo: CPU information structure
         """
         try:
-            # Get CPU name
-            cpu_names = query_wmic("wmic cpu get name")
-            cpu_name = cpu_names[0] if cpu_names else "Unknown CPU"
-            
-            # Get CPU details
             cpu_details = self._get_cpu_details()
             
             return CPUInfo(
-                name=cpu_name,
+                name=cpu_details.get('name') or "Unknown CPU",
                 cores=cpu_details.get('cores', 0),
                 threads=cpu_details.get('threads', 0),
                 architecture=cpu_details.get('architecture', ''),
@@ -105,39 +108,48 @@ class HardwareDetector:
             return CPUInfo(name=f"Detection Error: {str(e)}")
     
     def _get_cpu_details(self) -> Dict[str, any]:
-        """Get detailed CPU information."""
+        """Get detailed CPU information for the first processor."""
         details = {}
         
         try:
-            # Get core count
-            cores = query_wmic("wmic cpu get NumberOfCores")
+            return_code, stdout, stderr = run_command_with_timeout(CPU_WMIC_QUERY, timeout=WMI_QUERY_TIMEOUT)
+            if return_code != 0:
+                return details
+            
+            rows = [row for row in csv.reader(stdout.splitlines()) if row]
+            if len(rows) < 2:
+                return details
+            
+            # Columns come back in WMI's order, so map them by header
+            header = [column.strip().lower() for column in rows[0]]
+            cpu = dict(zip(header, (value.strip() for value in rows[1])))
+            
+            if cpu.get('name'):
+                details['name'] = cpu['name']
+            
+            cores = cpu.get('numberofcores', '')
             if cores:
-                details['cores'] = int(cores[0]) if cores[0].isdigit() else 0
+                details['cores'] = int(cores) if cores.isdigit() else 0
             
-            # Get thread count
-            threads = query_wmic("wmic cpu get NumberOfLogicalProcessors")
+            threads = cpu.get('numberoflogicalprocessors', '')
             if threads:
-                details['threads'] = int(threads[0]) if threads[0].isdigit() else 0
+                details['threads'] = int(threads) if threads.isdigit() else 0
             
-            # Get architecture
-            architecture = query_wmic("wmic cpu get Architecture")
+            architecture = cpu.get('architecture', '')
             if architecture:
                 arch_map = {'0': 'x86', '1': 'MIPS', '2': 'Alpha', '3': 'PowerPC', '6': 'Itanium', '9': 'x64'}
-                details['architecture'] = arch_map.get(architecture[0], 'Unknown')
+                details['architecture'] = arch_map.get(architecture, 'Unknown')
             
-            # Get clock speeds
-            max_speed = query_wmic("wmic cpu get MaxClockSpeed")
-            if max_speed and max_speed[0].isdigit():
-                details['max_clock_speed'] = f"{int(max_speed[0])} MHz"
+            max_speed = cpu.get('maxclockspeed', '')
+            if max_speed.isdigit():
+                details['max_clock_speed'] = f"{int(max_speed)} MHz"
             
-            current_speed = query_wmic("wmic cpu get CurrentClockSpeed")
-            if current_speed and current_speed[0].isdigit():
-                details['current_clock_speed'] = f"{int(current_speed[0])} MHz"
+            current_speed = cpu.get('currentclockspeed', '')
+            if current_speed.isdigit():
+                details['current_clock_speed'] = f"{int(current_speed)} MHz"
             
-            # Get manufacturer
-            manufacturer = query_wmic("wmic cpu get Manufacturer")
-            if manufacturer:
-                details['manufacturer'] = manufacturer[0]
+            if cpu.get('manufacturer'):
+                details['manufacturer'] = cpu['manufacturer']
                 
         except Exception:
             pass  # Return partial details on error